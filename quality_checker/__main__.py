@@ -1,11 +1,30 @@
 
 import typer
+from typer.core import TyperGroup
 
 
-app = typer.Typer(pretty_exceptions_show_locals=False)
+# names of the commands defined in quality_checker.quality_checker
+COMMAND_NAMES = ["quality_check_single", "quality_check_multiple"]
 
-from quality_checker.quality_checker import app as quality_app
-app.registered_commands = quality_app.registered_commands
+
+class LazyCommandGroup(TyperGroup):
+    """ Command group that only imports the quality checker (and its heavy dependencies) once a command is
+    resolved. """
+
+    def list_commands(self, ctx):
+        return list(COMMAND_NAMES)
+
+    def get_command(self, ctx, cmd_name):
+        from quality_checker.quality_checker import app as quality_app
+        return typer.main.get_group(quality_app).get_command(ctx, cmd_name)
+
+
+app = typer.Typer(cls=LazyCommandGroup, pretty_exceptions_show_locals=False)
+
+
+@app.callback()
+def main():
+    """ Quality checks for OpenSCENARIO files. """
 
 
 if __name__ == "__main__":
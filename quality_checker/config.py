@@ -1,22 +1,42 @@
 
-import matplotlib as mpl
+class _LazyColormap:
+    """ Colormap that is only looked up in matplotlib on first access, so importing the config does not import
+    matplotlib. """
+
+    def __init__(self, name):
+        self.name = name
+        self.colormap = None
+
+    def __get__(self, instance, owner):
+        if self.colormap is None:
+            import matplotlib as mpl
+            self.colormap = mpl.colormaps[self.name]
+        return self.colormap
 
 
 class Config:
     """ General configurations for the quality checker. """
     
     # colors and colormaps
-    EGO_COLORMAP = mpl.colormaps['Blues']
-    OTHER_COLORMAP = mpl.colormaps['Greens']
+    EGO_COLORMAP = _LazyColormap('Blues')
+    OTHER_COLORMAP = _LazyColormap('Greens')
     
     ERROR_COLOR = (255, 0, 0)
     WARNING_COLOR = (250, 95, 31)
+    # same colors as 0..1 floats for matplotlib
+    ERROR_COLOR_MPL = tuple(channel / 255 for channel in ERROR_COLOR)
+    WARNING_COLOR_MPL = tuple(channel / 255 for channel in WARNING_COLOR)
 
     # thresholds for errors and warnings
     ACCELERATION_ERROR_THRESHOLD = 9.8*2  # m/s^2
     ACCELERATION_WARNING_THRESHOLD = 9.8  # m/s^2
     SWIMANGLE_ERROR_THRESHOLD = 0.2  # radians
     SWIMANGLE_WARNING_THRESHOLD = 0.1  # radians
+    # squared thresholds, compared against squared values so no abs() pass is needed
+    ACCELERATION_ERROR_THRESHOLD_SQ = ACCELERATION_ERROR_THRESHOLD**2
+    ACCELERATION_WARNING_THRESHOLD_SQ = ACCELERATION_WARNING_THRESHOLD**2
+    SWIMANGLE_ERROR_THRESHOLD_SQ = SWIMANGLE_ERROR_THRESHOLD**2
+    SWIMANGLE_WARNING_THRESHOLD_SQ = SWIMANGLE_WARNING_THRESHOLD**2
 
     # PDF report font settings
     PDF_FONT_NAME = "Arial"
@@ -3,13 +3,35 @@ template for pdf file creation
 """
 
 from fpdf import FPDF
-import ctypes
+import functools
+import itertools
+import numpy as np
+
+# separate document only used for measuring text, so measuring never changes
+# the font state of the pdf that is being written
+_MEASURE_PDF = FPDF()
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_string_width(text, font, style, font_size):
+    """
+    get width of text, cached since reports repeat the same strings a lot
+    Args:
+        text: given text
+        font: name of font
+        style: font style (B, I, U)
+        font_size: size of font
+    return: width of text in mm
+    """
+    _MEASURE_PDF.set_font(font, style, font_size)
+    return _MEASURE_PDF.get_string_width(text)
 
 
 class PDF(FPDF):
     """
     creating a pdf file
     """
+
     def __init__(self, header_text=None, footer_text=None, font_type="Arial", font_size=15, color=(0, 0, 0)):
         """
         initialise layout of pdf
@@ -26,12 +48,19 @@ class PDF(FPDF):
         self.set_font(font_type, '', font_size)
         self.set_text_color(color)
         self.set_left_margin(20)
+        # compressed content streams and fixed bottom margin for page breaks
+        self.set_compression(True)
+        self.set_auto_page_break(True, margin=20)
+        # font and text color last set by create_textbox, None if they were changed elsewhere
+        self._last_font_state = None
+        self._last_text_color = None
 
     def header(self):
         """
         creating header if header is set
         """
         if self.header_text:
+            self._last_font_state = None
             # Arial bold 15
             self.set_font(self.defaut_font["name"], 'B', 15)
             # Title
@@ -49,6 +78,8 @@ class PDF(FPDF):
         # Arial italic 8
         self.set_font(self.defaut_font["name"], 'I', 9)
         self.set_text_color((0, 0, 0))
+        self._last_font_state = None
+        self._last_text_color = None
         # Page number
         self.cell(0, 10, 'Page ' + str(self.page_no()) + '/{nb}', 0, 0, 'R')
 
@@ -57,7 +88,8 @@ class PDF(FPDF):
             self.set_x(-105)
             self.cell(40, 10, self.footer_text, 0, 0, "C")
 
-    def create_textbox(self, text, font=None, color=(0, 0, 0), set_box=False, relative_position=None, absolute_position=None):
+    def create_textbox(self, text, font=None, color=(0, 0, 0), set_box=False, relative_position=None, absolute_position=None,
+                       x_position=None):
         """
         create text box
         Args:
@@ -66,15 +98,14 @@ class PDF(FPDF):
             set_box: black line around text if wanted
             relative_position: offset from actual position
             absolute_position: absolute possition of text box
+            x_position: absolute x position of text box in mm, applied after the offsets
         """
         if not font:
             font = self.defaut_font
-        self.set_font(font["name"], font["type"], font["size"])
-        if color is not None:
-            self.set_text_color(color)
+        self._set_text_style(font, color)
 
         boarder = 1 if set_box else 0
-        text_length, text_height = self._get_text_dimensions(text, font["name"], font["size"])
+        text_length, text_height = self._get_text_dimensions(text, font["name"], font["size"], font["type"])
 
         if relative_position:
             self._set_relative_offset(relative_position[0], relative_position[1])
@@ -82,15 +113,44 @@ class PDF(FPDF):
             if absolute_position:
                 self.set_x(absolute_position[0])
                 self.set_y(absolute_position[1])
+        if x_position is not None:
+            self.set_x(x_position)
         self.cell(text_length, text_height, text, boarder, 0, "L")
 
         self.ln(text_height)
 
+    def create_checklist(self, items, font=None, ding_font=None, separation=0, indent="     "):
+        """
+        create rows of check marks (or crosses) each followed by a text
+        Args:
+            items: list of (passed, text, color), passed rows get a check mark and the others a cross
+            font: font of the texts
+            ding_font: dingbats font of the marks
+            separation: vertical offset of each row from the end of the previous one
+            indent: indentation of the marks, texts are indented twice as much
+        """
+        if not font:
+            font = self.defaut_font
+        for passed, text, color in items:
+            # mark and text share one line
+            self.set_y(self.get_y() + separation)
+            mark = indent + ("4" if passed else "8")
+            self._set_text_style(ding_font, color)
+            self.cell(self._get_text_dimensions(mark, ding_font["name"], ding_font["size"], ding_font["type"])[0],
+                      ding_font["size"], mark, 0, 0, "L")
+
+            text = 2 * indent + text
+            self.set_x(self.l_margin)
+            self._set_text_style(font, color)
+            self.cell(self._get_text_dimensions(text, font["name"], font["size"], font["type"])[0],
+                      font["size"], text, 0, 0, "L")
+            self.ln(font["size"])
+
     def create_image(self, image_path, size, relative_position=None, absolute_position=None):
         """
         sets an image in pdf
         Args:
-            image_path: path of image
+            image_path: path of image, file-like object with image data or PIL image
             size: size of the image in mm
             relative_position: offset from actual position
             absolute_position: absolute position on page - only used if relative_position not set
@@ -130,6 +190,7 @@ class PDF(FPDF):
         if not font_size:
             font_size = self.defaut_font["size"]
         self.set_font(font, '', font_size)
+        self._last_font_state = None
         if not title_font:
             title_font = {"style": font, "size": font_size+3}
         if show_lines:
@@ -139,11 +200,11 @@ class PDF(FPDF):
         if not cell_position:
             cell_position = ["C"] * len(data[0])
 
-        # put information in one list
+        # put information in one list, cells are converted to text once
         information = []
         if columns:
-            information.append(columns)
-        information.extend(data)
+            information.append([str(column) for column in columns])
+        information.extend([str(cell) for cell in row] for row in data)
 
         # set offset for initial offset
         if relative_position:
@@ -167,34 +228,41 @@ class PDF(FPDF):
             if not size_columns:
                 size_columns = [0] * len(information[0])
                 check_for_columns = True
-            for index_column, column in enumerate(information[0]):
-                for index_row, row in enumerate(information):
-                    cell = information[index_row][index_column]
-                    length, height = self._get_text_dimensions(str(cell), font, font_size)
-                    if check_for_rows:
-                        size_rows[index_row] = max(size_rows[index_row], height)
-                    if check_for_columns:
-                        size_columns[index_column] = max(size_columns[index_column], length)
+            # text heights only depend on the font size, widths are measured per cell (cached for
+            # repeated strings) and reduced per column with numpy
+            if check_for_rows:
+                size_rows = [font_size] * len(information)
+            if check_for_columns:
+                cell_length = self._get_text_dimensions
+                n_columns = len(information[0])
+                # the header row is drawn in bold and measured so
+                lengths = np.fromiter((cell_length(cell, font, font_size, 'B' if index_row == 0 and columns else '')[0]
+                                       for index_row, row in enumerate(information) for cell in row),
+                                      dtype=float, count=len(information) * n_columns)
+                size_columns = lengths.reshape(-1, n_columns).max(axis=0).tolist()
 
         # plot header
         if title:
-            title_dimensions = self._get_text_dimensions(title, title_font["style"], title_font["size"])
+            title_dimensions = self._get_text_dimensions(title, title_font["style"], title_font["size"], 'B')
             self.cell(max(0.01, x_offset), title_dimensions[1], "", 0, 0, "C")
             self.set_font(title_font["style"], "B", title_font["size"])
             self.cell(title_dimensions[0], title_dimensions[1], title, 0, 0, "L")
             self.ln(title_dimensions[1])
 
         # plot table
+        # every row starts at the left margin, the column starts are fixed for the whole table
+        x_starts = list(itertools.accumulate(size_columns[:-1], initial=self.l_margin + max(x_offset, 0.01)))
+
+        # header row in bold, font is only changed when switching to the body rows
+        self.set_font(font, 'B' if columns else '', font_size)
         for index_row, row in enumerate(information):
-            self.cell(max(x_offset, 0.01), 0.1, "", 0, 0, "C")
-            for index_column, column in enumerate(information[0]):
-                if index_row == 0 and columns:
-                    self.set_font(font, 'B', font_size)
-                    self.cell(size_columns[index_column], size_rows[index_row], str(information[index_row][index_column]), show_lines, 0, cell_position[index_column])
-                else:
-                    self.set_font(font, '', font_size)
-                    self.cell(size_columns[index_column], size_rows[index_row], str(information[index_row][index_column]), show_lines, 0, cell_position[index_column])
-            self.ln(size_rows[index_row])
+            if index_row == 1 and columns:
+                self.set_font(font, '', font_size)
+            row_height = size_rows[index_row]
+            for x_start, size_column, position, cell in zip(x_starts, size_columns, cell_position, row):
+                self.set_x(x_start)
+                self.cell(size_column, row_height, cell, show_lines, 0, position)
+            self.ln(row_height)
             
     def create_line(self, color=(0, 0, 0), relative_position=None, absolute_position=None):
         x_position, y_position = 0, 0
@@ -208,6 +276,21 @@ class PDF(FPDF):
                 
         self.line(x_position, y_position, x_position+170, y_position)
             
+    def _set_text_style(self, font, color):
+        """
+        set font and text color, skipped if they did not change since the last call
+        Args:
+            font: font dict with name, type and size
+            color: text color, None keeps the current color
+        """
+        font_state = (font["name"], font["type"], font["size"])
+        if font_state != self._last_font_state:
+            self.set_font(*font_state)
+            self._last_font_state = font_state
+        if color is not None and color != self._last_text_color:
+            self.set_text_color(color)
+            self._last_text_color = color
+
     def _set_relative_offset(self, offset_x, offset_y):
         """
         create an offset from last cell
@@ -218,32 +301,15 @@ class PDF(FPDF):
         self.set_x(self.get_x() + offset_x)
         self.set_y(self.get_y() + offset_y)
 
-    @staticmethod
-    def _get_text_dimensions(text, font, font_size):
+    def _get_text_dimensions(self, text, font, font_size, style=''):
         """
         get length and width of text
         Args:
             text: given text
             font: style
             font_size: size of style
+            style: font style (B, I, U) used for measuring
         return: length and height of text
         """
-        try:
-            # accurate calculation for windows
-            class SIZE(ctypes.Structure):
-                _fields_ = [("cx", ctypes.c_long), ("cy", ctypes.c_long)]
-
-            hdc = ctypes.windll.user32.GetDC(0)
-            hfont = ctypes.windll.gdi32.CreateFontA(font_size, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, font)
-            hfont_old = ctypes.windll.gdi32.SelectObject(hdc, hfont)
-
-            size = SIZE(0, 0)
-            ctypes.windll.gdi32.GetTextExtentPoint32A(hdc, text, len(text), ctypes.byref(size))
-
-            ctypes.windll.gdi32.SelectObject(hdc, hfont_old)
-            ctypes.windll.gdi32.DeleteObject(hfont)
-
-            return size.cx, size.cy
-        except AttributeError:
-            # less accurate for other enviroments
-            return font_size * len(text) * 0.5, font_size
+        # fpdf core font metrics, cell margins are added so the text fits into its cell
+        return _get_string_width(text, font, style, font_size) + 2 * self.c_margin, font_size
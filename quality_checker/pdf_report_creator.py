@@ -1,17 +1,24 @@
 
+import functools
 from loguru import logger
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-from matplotlib.lines import Line2D
 import numpy as np
 from pathlib import Path
-import tempfile
 import xml.etree.ElementTree as ET
 
-from .pdf import *
+from .pdf import PDF
 
 from .config import Config
 
+# vertical spacing between report lines and the matching text box offsets
+_TITLE_SEPARATION = -5
+_SUBTITLE_SEPARATION = -4
+_POS_TITLE = (0, _TITLE_SEPARATION)
+_POS_SUBTITLE = (0, _SUBTITLE_SEPARATION)
+_POS_2TITLE = (0, 2 * _TITLE_SEPARATION)
+_POS_2SUBTITLE = (0, 2 * _SUBTITLE_SEPARATION)
+
+# zlib level of the PNG files written next to the reports (PIL default is 6)
+_PNG_COMPRESS_LEVEL = 3
 
 
 def create_report_single(checker, title, out_path):
@@ -22,315 +29,208 @@ def create_report_single(checker, title, out_path):
         title: Title shown in the PDF header.
         out_path: Output directory for the PDF.
     """
-    title_separation = -5
-    subtitle_separation = -4
-    
     pdf = PDF(title)
     pdf.add_page()
     
     Path(out_path).mkdir(parents=True, exist_ok=True)
 
     scenario_path = Path(checker.file_path)
-    pdf.create_textbox('General information', relative_position=[0, title_separation], font=Config.PDF_FONT_TITLE)
-    pdf.create_textbox('     Scenario file: ' + scenario_path.name, relative_position=[0, subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
+    out_file = Path(out_path) / f'{scenario_path.stem}.pdf'
+    pdf.create_textbox('General information', relative_position=_POS_TITLE, font=Config.PDF_FONT_TITLE)
+    pdf.create_textbox(f'     Scenario file: {scenario_path.name}', relative_position=_POS_SUBTITLE, font=Config.PDF_FONT_SUBTITLE)
 
     # XML must be parsable before any deeper checks are meaningful.
-    if checker.xml_loadable:
-        # XSD validity gates scenario-specific checks and plots.
-        if checker.xsd_valid:
-            # Scenario metadata (fallback to "-" when not provided).
-            author = 'Scenario author: '
-            author += checker.author if checker.author else '-'
-            pdf.create_textbox('     ' + author, relative_position=[0, subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-            
-            date = 'Scenario creation date: '
-            date += checker.date if checker.date else '-'
-            pdf.create_textbox('     ' + date, relative_position=[0, subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-
-            simulation_status = 'Simulation: '
-            simulation_status_value = getattr(checker, 'simulation_status', 'not done')
-            simulation_status += simulation_status_value
-            simulation_status_color = Config.ERROR_COLOR if simulation_status_value == 'failed' else (0, 0, 0)
-            
-            # Scenario object required for counts, issues, and dynamics plots.
-            if checker.scenario is not None:
-                
-                n_roadusers = 'Road users in scenario: '
-                road_users = checker.road_user_counts or {}
-                n_total = road_users.get('total', 0)
-                n_roadusers += str(n_total)
-                pdf.create_textbox('     ' + n_roadusers, relative_position=[0, subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-                
-                for RU_type, count in road_users.items():
-                    if RU_type != 'total' and RU_type is not None:
-                        pdf.create_textbox('     ' + '      - ' + str(count) + ' ' + RU_type + 's', relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE)
-
-                pdf.create_textbox('     ' + simulation_status, relative_position=[0, subtitle_separation], font=Config.PDF_FONT_SUBTITLE, color=simulation_status_color)
-                
-                # Ensure a stable tuple shape for downstream unpacking.
-                dynamic_errors = checker.dynamic_errors or ([], [], [], [])
-                acceleration_errors, acceleration_warnings, swimangle_errors, swimangle_warnings = dynamic_errors
-                simulation_based_dynamics = simulation_status_value == 'succeeded'
-                simulation_not_valid = simulation_status_value != 'succeeded'
-                dynamic_has_footnote = simulation_based_dynamics or simulation_not_valid
-                analyzed_dynamics = {
-                    "acceleration_errors": acceleration_errors,
-                    "acceleration_warnings": acceleration_warnings,
-                    "swimangle_errors": swimangle_errors,
-                    "swimangle_warnings": swimangle_warnings,
-                }
-                # Render plots into a temporary directory before embedding in the PDF.
-                temp_dir = tempfile.TemporaryDirectory()
-                temp_dir_path = Path(temp_dir.name)
-                plot_dynamics(checker, analyzed_dynamics, output_dir=temp_dir_path)
+    if not checker.xml_loadable:
+        # File is not parseable as XML.
+        pdf.create_textbox('File is not in XML format', relative_position=_POS_TITLE, font=Config.PDF_FONT_TITLE)
+        pdf.output(out_file)
+        return
 
-                try:
-                    pdf.create_image(temp_dir_path / 'vehicle_paths.png', relative_position=[85, -27], size=(int(588/6), int(432/6)))
-                except Exception:
-                    pass
-
-                pdf.create_textbox('Scenario evaluation', relative_position=[0, title_separation+5], font=Config.PDF_FONT_TITLE)
-                # Grouped file-level issues (empty lists mean no issues).
-                file_errors = checker.file_errors or ([], [], [], [])
-                position_resolution_warnings = getattr(checker, 'position_resolution_warnings', []) or []
-                # File issues section: show green checks when none exist.
-                if np.sum([len(file_error) for file_error in file_errors]) == 0:
-                    pdf.create_textbox(text="4", relative_position=[0, title_separation+2], font=Config.PDF_FONT_DING_TITLE)
-                    pdf.create_textbox('     No file issues: ', relative_position=[0, 2*title_separation], font=Config.PDF_FONT_TITLE_SMALL)
-                    pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-                    pdf.create_textbox('          No faulty entity definitions', relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-                    pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-                    pdf.create_textbox('          No identical initial positions', relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-                    pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-                    pdf.create_textbox('          No intersecting entities', relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-                    pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-                    pdf.create_textbox('          No missing adds/inits', relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-
-                    if len(position_resolution_warnings) > 0:
-                        for warning in position_resolution_warnings:
-                            pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], 
-                                               font=Config.PDF_FONT_DING_SUB, color=Config.WARNING_COLOR)
-                            pdf.create_textbox('          ' + warning, relative_position=[0, 2*subtitle_separation], 
-                                               font=Config.PDF_FONT_SUBTITLE, color=Config.WARNING_COLOR)
-                else:
-                    # File issues section: show errors per category.
-                    missing_entity_definitions, identical_initposition_entities, intersecting_entities, missing_in = file_errors
-                    pdf.create_textbox(text="8", relative_position=[0, title_separation+2], 
-                                       font=Config.PDF_FONT_DING_TITLE, color=Config.ERROR_COLOR)
-                    pdf.create_textbox('     File issues', relative_position=[0, 2*title_separation], 
-                                       font=Config.PDF_FONT_TITLE_SMALL, color=Config.ERROR_COLOR)
-                    # Faulty entity definitions.
-                    if len(missing_entity_definitions) > 0:
-                        pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB, color=Config.ERROR_COLOR)
-                        pdf.create_textbox('          Faulty entity definitions: ' + str(', '.join(missing_entity_definitions)), relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
-                    else:
-                        pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB)
-                        pdf.create_textbox('          No faulty entity definitions', relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE)
-                    
-                    # Identical initial positions.
-                    if len(identical_initposition_entities) > 0:
-                        pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB, color=Config.ERROR_COLOR)
-                        # Single pair vs. multiple pairs formatting.
-                        if len(identical_initposition_entities) == 1:
-                            identical_initposition_entities = identical_initposition_entities[0]
-                            
-                            pdf.create_textbox('          Identical initial positions: ' + str(', '.join(identical_initposition_entities)), relative_position=[0, 2*subtitle_separation], 
-                                            font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
-                        else:
-                            identical_initposition_entities = [str(tuple(element)).replace("'", "") for element in identical_initposition_entities]
-                            
-                            pdf.create_textbox('          Identical initial positions: ' + str(', '.join(identical_initposition_entities)), relative_position=[0, 2*subtitle_separation], 
-                                            font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
-                    else:
-                        pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB)
-                        pdf.create_textbox('          No identical initial positions', relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE)
-                    
-                    # Intersecting entities.
-                    if len(intersecting_entities) > 0:
-                        pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB, color=Config.ERROR_COLOR)
-                        # Single pair vs. multiple pairs formatting.
-                        if len(intersecting_entities) == 1:
-                            intersecting_entities = intersecting_entities[0]
-                            pdf.create_textbox('          Intersecting entities: ' + str(', '.join(intersecting_entities)), relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
-                        else:
-                            intersecting_entities = [str(tuple(element)).replace("'", "") for element in intersecting_entities]
-                            pdf.create_textbox('          Intersecting entities: ' + str(', '.join(intersecting_entities)), relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
-                    else:
-                        pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB)
-                        pdf.create_textbox('          No intersecting entities', relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE)
-                    
-                    # Missing add/init entries.
-                    if len(missing_in) > 0:
-                        pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB, color=Config.ERROR_COLOR)
-                        pdf.create_textbox('          Missing add/init: ' + str(', '.join(missing_in)), relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
-                    else:
-                        pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB)
-                        pdf.create_textbox('          No missing adds/inits', relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE)
-
-                    if len(position_resolution_warnings) > 0:
-                        for warning in position_resolution_warnings:
-                            pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], 
-                                               font=Config.PDF_FONT_DING_SUB, color=Config.WARNING_COLOR)
-                            pdf.create_textbox('          ' + warning, relative_position=[0, 2*subtitle_separation], 
-                                               font=Config.PDF_FONT_SUBTITLE, color=Config.WARNING_COLOR)
-                    
-                # Dynamic issues section: show green checks when none exist.
-                if np.sum([len(dynamic_error) for dynamic_error in dynamic_errors]) == 0:
-                    dynamic_no_issues_title = '     No dynamic issues*' if dynamic_has_footnote else '     No dynamic issues'
-                    pdf.create_textbox(text="4", relative_position=[0, title_separation+4], font=Config.PDF_FONT_DING_TITLE)
-                    pdf.create_textbox(dynamic_no_issues_title, relative_position=[0, 2*title_separation], font=Config.PDF_FONT_TITLE_SMALL)
-                    pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-                    pdf.create_textbox('          No acceleration errors', relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-                    pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-                    pdf.create_textbox('          No swim angle errors', relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-                    pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-                    pdf.create_textbox('          No acceleration warnings', relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-                    pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-                    pdf.create_textbox('          No swim angle warnings', relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE)
-                else:
-                    # Dynamic issues section: errors/warnings per category.
-                    dynamic_issues_title = '     Dynamic issues*' if dynamic_has_footnote else '     Dynamic issues'
-                    pdf.create_textbox(text="8", relative_position=[0, title_separation+4], 
-                                       font=Config.PDF_FONT_DING_TITLE, color=Config.ERROR_COLOR)
-                    pdf.create_textbox(dynamic_issues_title, relative_position=[0, 2*title_separation], 
-                                       font=Config.PDF_FONT_TITLE_SMALL, color=Config.ERROR_COLOR)
-                    # Acceleration errors.
-                    if len(acceleration_errors) > 0:
-                        pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB, color=Config.ERROR_COLOR)
-                        pdf.create_textbox('          Acceleration errors: ' + str(acceleration_errors), relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
-                    else:
-                        pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB)
-                        pdf.create_textbox('          No acceleration errors', relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE)
-                    
-                    # Swim angle errors.
-                    if len(swimangle_errors) > 0:
-                        pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB, color=Config.ERROR_COLOR)
-                        pdf.create_textbox('          Swim angle errors: ' + str(swimangle_errors), relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
-                    else:
-                        pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB)
-                        pdf.create_textbox('          No swim angle errors', relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE)
-                    
-                    # Acceleration warnings.
-                    if len(acceleration_warnings) > 0:
-                        pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB, color=Config.WARNING_COLOR)
-                        pdf.create_textbox('          Acceleration warnings: ' + str(acceleration_warnings), relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE, color=Config.WARNING_COLOR)
-                    else:
-                        pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB)
-                        pdf.create_textbox('          No acceleration warnings', relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE)
-                    
-                    # Swim angle warnings.
-                    if len(swimangle_warnings) > 0:
-                        pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB, color=Config.WARNING_COLOR)
-                        pdf.create_textbox('          Swim angle warnings: ' + str(swimangle_warnings), relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE, color=Config.WARNING_COLOR)
-                    else:
-                        pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], 
-                                           font=Config.PDF_FONT_DING_SUB)
-                        pdf.create_textbox('          No swim angle warnings', relative_position=[0, 2*subtitle_separation], 
-                                           font=Config.PDF_FONT_SUBTITLE)
+    # XSD validity gates scenario-specific checks and plots.
+    if not checker.xsd_valid:
+        # XML is parseable but does not validate against the XSD.
+        pdf.create_textbox('File is not in XSD format', relative_position=_POS_TITLE, font=Config.PDF_FONT_TITLE)
+
+        # If available, include concrete XSD validation messages in the PDF.
+        xsd_errors = getattr(checker, 'xsd_errors', []) or []
+        if len(xsd_errors) > 0:
+            # Start the XSD error block a bit further below the heading.
+            pdf.create_textbox('XSD validation errors:', relative_position=[0, 0], font=Config.PDF_FONT_TITLE_SMALL, color=Config.ERROR_COLOR)
+
+            # Show each error fully, but wrapped into multiple lines so that
+            # it fits into the page width.
+            max_len = 120
+            for err in xsd_errors:
+                full_text = ' - ' + str(err)
+                text = full_text
+                first_line = True
+                while len(text) > max_len:
+                    line = text[:max_len]
+                    pdf.create_textbox(line, relative_position=_POS_SUBTITLE, font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
+                    # Indent continuation lines slightly.
+                    text = '   ' + text[max_len:]
+                    first_line = False
+                # Remainder (or whole text if shorter than max_len).
+                pdf.create_textbox(text, relative_position=_POS_SUBTITLE, font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
+
+        pdf.output(out_file)
+        return
 
-                # Optional diagnostics plots (can fail if no usable data is present).
-                try:
-                    pdf.create_image(temp_dir_path / 'speed_plot.png', relative_position=[85, -12], size=(int(588/6), int(432/6)))
-                    pdf.create_image(temp_dir_path / 'acceleration_plot.png', relative_position=[-10, 60], size=(int(588/6), int(432/6)))
-                    pdf.create_image(temp_dir_path / 'swimangle_plot.png', relative_position=[85, 60], size=(int(588/6), int(432/6)))
-                    if len(acceleration_warnings) + len(acceleration_errors) + len(swimangle_warnings) + len(swimangle_errors) > 0:
-                        pdf.create_textbox("Note: Paths for all road users are plotted, but speed, acceleration, and swim angle are shown only for entities facing dynamic issues.",
-                                    relative_position=[0, 135], font=Config.PDF_FONT_SUBTITLE_REGULAR)
-                    else:
-                        pdf.create_textbox("Note: Paths for all road users are plotted, but speed, acceleration, and swim angle are shown only for ego and up to other 4 entities.",
-                                    relative_position=[0, 135], font=Config.PDF_FONT_SUBTITLE_REGULAR)
-                except Exception:
-                    pdf.create_textbox("Note: Graphs could not be generated because envelope does not contain any stories.", 
-                                    relative_position=[0, 135], font=Config.PDF_FONT_SUBTITLE_REGULAR)
-
-                if simulation_based_dynamics:
-                    pdf.create_textbox(
-                        "* Dynamic evaluation is influenced by simulator interpretion.",
-                        relative_position=[0, 2],
-                        font=Config.PDF_FONT_SUBTITLE_REGULAR,
-                    )
-                elif simulation_not_valid:
-                    pdf.create_textbox(
-                        "* Assessment only based on TrajectoryActions.",
-                        relative_position=[0, 2],
-                        font=Config.PDF_FONT_SUBTITLE_REGULAR,
-                    )
-
-                temp_dir.cleanup()
-                    
-                report_file = Path(scenario_path.stem + '.pdf')
-                out = out_path / report_file
-                pdf.output(out)
-            else:
-                # Scenario failed to load even though XML/XSD checks passed.
-                pdf.create_textbox('Scenario could not be loaded', relative_position=[0, title_separation], font=Config.PDF_FONT_TITLE)
-                out = out_path / Path(scenario_path.stem + '.pdf')
-                pdf.output(out)
+    # Scenario metadata (fallback to "-" when not provided).
+    pdf.create_textbox(f"     Scenario author: {checker.author or '-'}", relative_position=_POS_SUBTITLE, font=Config.PDF_FONT_SUBTITLE)
+    pdf.create_textbox(f"     Scenario creation date: {checker.date or '-'}", relative_position=_POS_SUBTITLE, font=Config.PDF_FONT_SUBTITLE)
+
+    simulation_status_value = getattr(checker, 'simulation_status', 'not done')
+    simulation_status = f'Simulation: {simulation_status_value}'
+    simulation_status_color = Config.ERROR_COLOR if simulation_status_value == 'failed' else (0, 0, 0)
+
+    # Scenario object required for counts, issues, and dynamics plots.
+    if checker.scenario is None:
+        # Scenario failed to load even though XML/XSD checks passed.
+        pdf.create_textbox('Scenario could not be loaded', relative_position=_POS_TITLE, font=Config.PDF_FONT_TITLE)
+        pdf.output(out_file)
+        return
+
+    road_users = checker.road_user_counts or {}
+    pdf.create_textbox(f"     Road users in scenario: {road_users.get('total', 0)}", relative_position=_POS_SUBTITLE, font=Config.PDF_FONT_SUBTITLE)
+
+    for RU_type, count in road_users.items():
+        if RU_type != 'total' and RU_type is not None:
+            pdf.create_textbox(f'           - {count} {RU_type}s', relative_position=_POS_SUBTITLE, 
+                               font=Config.PDF_FONT_SUBTITLE)
+
+    pdf.create_textbox(f'     {simulation_status}', relative_position=_POS_SUBTITLE, font=Config.PDF_FONT_SUBTITLE, color=simulation_status_color)
+
+    # Ensure a stable tuple shape for downstream unpacking.
+    dynamic_errors = checker.dynamic_errors or ([], [], [], [])
+    acceleration_errors, acceleration_warnings, swimangle_errors, swimangle_warnings = dynamic_errors
+    simulation_based_dynamics = simulation_status_value == 'succeeded'
+    simulation_not_valid = simulation_status_value != 'succeeded'
+    dynamic_has_footnote = simulation_based_dynamics or simulation_not_valid
+    analyzed_dynamics = {
+        "acceleration_errors": acceleration_errors,
+        "acceleration_warnings": acceleration_warnings,
+        "swimangle_errors": swimangle_errors,
+        "swimangle_warnings": swimangle_warnings,
+    }
+    # Plots are rendered to in-memory PNGs and embedded directly.
+    images = plot_dynamics(checker, analyzed_dynamics)
+
+    if 'vehicle_paths' in images:
+        pdf.create_image(images['vehicle_paths'], relative_position=[85, -27], size=(int(588/6), int(432/6)))
+
+    pdf.create_textbox('Scenario evaluation', relative_position=[0, _TITLE_SEPARATION+5], font=Config.PDF_FONT_TITLE)
+    # Grouped file-level issues (empty lists mean no issues).
+    file_errors = checker.file_errors or ([], [], [], [])
+    position_resolution_warnings = getattr(checker, 'position_resolution_warnings', []) or []
+    # File issues section: one row per category, position resolution problems as warnings.
+    missing_entity_definitions, identical_initposition_entities, intersecting_entities, missing_in = file_errors
+    file_issue_items = [
+        _checklist_item(missing_entity_definitions, f"Faulty entity definitions: {', '.join(missing_entity_definitions)}",
+                        'No faulty entity definitions', Config.ERROR_COLOR),
+        _checklist_item(identical_initposition_entities, f'Identical initial positions: {_format_entity_groups(identical_initposition_entities)}',
+                        'No identical initial positions', Config.ERROR_COLOR),
+        _checklist_item(intersecting_entities, f'Intersecting entities: {_format_entity_groups(intersecting_entities)}',
+                        'No intersecting entities', Config.ERROR_COLOR),
+        _checklist_item(missing_in, f"Missing add/init: {', '.join(missing_in)}",
+                        'No missing adds/inits', Config.ERROR_COLOR),
+    ]
+    file_issue_items += [(False, warning, Config.WARNING_COLOR) for warning in position_resolution_warnings]
+
+    if not any(file_errors):
+        pdf.create_textbox(text="4", relative_position=[0, _TITLE_SEPARATION+2], font=Config.PDF_FONT_DING_TITLE)
+        pdf.create_textbox('     No file issues: ', relative_position=_POS_2TITLE, font=Config.PDF_FONT_TITLE_SMALL)
+    else:
+        pdf.create_textbox(text="8", relative_position=[0, _TITLE_SEPARATION+2], 
+                           font=Config.PDF_FONT_DING_TITLE, color=Config.ERROR_COLOR)
+        pdf.create_textbox('     File issues', relative_position=_POS_2TITLE, 
+                           font=Config.PDF_FONT_TITLE_SMALL, color=Config.ERROR_COLOR)
+    pdf.create_checklist(file_issue_items, font=Config.PDF_FONT_SUBTITLE, ding_font=Config.PDF_FONT_DING_SUB,
+                         separation=_SUBTITLE_SEPARATION)
+
+    # Dynamic issues section: errors/warnings per category.
+    dynamic_issue_items = [
+        _checklist_item(acceleration_errors, f'Acceleration errors: {acceleration_errors}',
+                        'No acceleration errors', Config.ERROR_COLOR),
+        _checklist_item(swimangle_errors, f'Swim angle errors: {swimangle_errors}',
+                        'No swim angle errors', Config.ERROR_COLOR),
+        _checklist_item(acceleration_warnings, f'Acceleration warnings: {acceleration_warnings}',
+                        'No acceleration warnings', Config.WARNING_COLOR),
+        _checklist_item(swimangle_warnings, f'Swim angle warnings: {swimangle_warnings}',
+                        'No swim angle warnings', Config.WARNING_COLOR),
+    ]
+
+    has_dynamic_issues = any(dynamic_errors)
+    if not has_dynamic_issues:
+        dynamic_no_issues_title = '     No dynamic issues*' if dynamic_has_footnote else '     No dynamic issues'
+        pdf.create_textbox(text="4", relative_position=[0, _TITLE_SEPARATION+4], font=Config.PDF_FONT_DING_TITLE)
+        pdf.create_textbox(dynamic_no_issues_title, relative_position=_POS_2TITLE, font=Config.PDF_FONT_TITLE_SMALL)
+    else:
+        dynamic_issues_title = '     Dynamic issues*' if dynamic_has_footnote else '     Dynamic issues'
+        pdf.create_textbox(text="8", relative_position=[0, _TITLE_SEPARATION+4], 
+                           font=Config.PDF_FONT_DING_TITLE, color=Config.ERROR_COLOR)
+        pdf.create_textbox(dynamic_issues_title, relative_position=_POS_2TITLE, 
+                           font=Config.PDF_FONT_TITLE_SMALL, color=Config.ERROR_COLOR)
+    pdf.create_checklist(dynamic_issue_items, font=Config.PDF_FONT_SUBTITLE, ding_font=Config.PDF_FONT_DING_SUB,
+                         separation=_SUBTITLE_SEPARATION)
+
+    # Optional diagnostics plots (missing if no usable data is present).
+    if all(name in images for name in ('speed', 'acceleration', 'swimangle')):
+        pdf.create_image(images['speed'], relative_position=[85, -12], size=(int(588/6), int(432/6)))
+        pdf.create_image(images['acceleration'], relative_position=[-10, 60], size=(int(588/6), int(432/6)))
+        pdf.create_image(images['swimangle'], relative_position=[85, 60], size=(int(588/6), int(432/6)))
+        if has_dynamic_issues:
+            pdf.create_textbox("Note: Paths for all road users are plotted, but speed, acceleration, and swim angle are shown only for entities facing dynamic issues.",
+                        relative_position=[0, 135], font=Config.PDF_FONT_SUBTITLE_REGULAR)
         else:
-            # XML is parseable but does not validate against the XSD.
-            pdf.create_textbox('File is not in XSD format', relative_position=[0, title_separation], font=Config.PDF_FONT_TITLE)
-
-            # If available, include concrete XSD validation messages in the PDF.
-            xsd_errors = getattr(checker, 'xsd_errors', []) or []
-            if len(xsd_errors) > 0:
-                # Start the XSD error block a bit further below the heading.
-                pdf.create_textbox('XSD validation errors:', relative_position=[0, 0], font=Config.PDF_FONT_TITLE_SMALL, color=Config.ERROR_COLOR)
-
-                # Show each error fully, but wrapped into multiple lines so that
-                # it fits into the page width.
-                max_len = 120
-                for err in xsd_errors:
-                    full_text = ' - ' + str(err)
-                    text = full_text
-                    first_line = True
-                    while len(text) > max_len:
-                        line = text[:max_len]
-                        pdf.create_textbox(line, relative_position=[0, subtitle_separation], font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
-                        # Indent continuation lines slightly.
-                        text = '   ' + text[max_len:]
-                        first_line = False
-                    # Remainder (or whole text if shorter than max_len).
-                    pdf.create_textbox(text, relative_position=[0, subtitle_separation], font=Config.PDF_FONT_SUBTITLE, color=Config.ERROR_COLOR)
-
-            out = out_path / Path(scenario_path.stem + '.pdf')
-            pdf.output(out)
+            pdf.create_textbox("Note: Paths for all road users are plotted, but speed, acceleration, and swim angle are shown only for ego and up to other 4 entities.",
+                        relative_position=[0, 135], font=Config.PDF_FONT_SUBTITLE_REGULAR)
     else:
-        # File is not parseable as XML.
-        pdf.create_textbox('File is not in XML format', relative_position=[0, title_separation], font=Config.PDF_FONT_TITLE)
-        out = out_path / Path(scenario_path.stem + '.pdf')
-        pdf.output(out)
-        
+        pdf.create_textbox("Note: Graphs could not be generated because envelope does not contain any stories.", 
+                        relative_position=[0, 135], font=Config.PDF_FONT_SUBTITLE_REGULAR)
+
+    if simulation_based_dynamics:
+        pdf.create_textbox(
+            "* Dynamic evaluation is influenced by simulator interpretion.",
+            relative_position=[0, 2],
+            font=Config.PDF_FONT_SUBTITLE_REGULAR,
+        )
+    elif simulation_not_valid:
+        pdf.create_textbox(
+            "* Assessment only based on TrajectoryActions.",
+            relative_position=[0, 2],
+            font=Config.PDF_FONT_SUBTITLE_REGULAR,
+        )
+
+    pdf.output(out_file)
+
+
+def _checklist_item(issues, issue_text, ok_text, color):
+    """
+    Build one checklist row of the single report.
+    Args:
+        issues: Issues of the category, empty if there are none.
+        issue_text: Text shown if there are issues.
+        ok_text: Text shown if there are no issues.
+        color: Text color if there are issues.
+    return: Tuple of (passed, text, color) for PDF.create_checklist.
+    """
+    if len(issues) > 0:
+        return (False, issue_text, color)
+    return (True, ok_text, (0, 0, 0))
+
+
+def _format_entity_groups(entity_groups):
+    """
+    Format groups of entities (e.g. intersecting pairs) for the report.
+    Args:
+        entity_groups: List of entity name groups.
+    return: Names of a single group, otherwise each group in parentheses.
+    """
+    if len(entity_groups) == 1:
+        return ', '.join(entity_groups[0])
+    return ', '.join(f"({', '.join(group)})" for group in entity_groups)
+
 
 def add_error_warning_lines(ax, variable):
     """
@@ -346,8 +246,8 @@ def add_error_warning_lines(ax, variable):
     else:
         raise ValueError(f"Unsupported variable for thresholds: {variable!r}")
     
-    err_col = tuple(np.array(Config.ERROR_COLOR)/255)
-    warn_col = tuple(np.array(Config.WARNING_COLOR)/255)
+    err_col = Config.ERROR_COLOR_MPL
+    warn_col = Config.WARNING_COLOR_MPL
     
     # Calculate current axis height to determine if text will overlap
     ymin, ymax = ax.get_ylim()
@@ -366,10 +266,11 @@ def add_error_warning_lines(ax, variable):
 
     trans = ax.get_yaxis_transform()
 
+    # Draw the lines at the exact thresholds, one collection per color spanning the whole axes width
+    ax.hlines([error_threshold, -error_threshold], 0, 1, transform=trans, linestyles=[(0, (5, 10))], colors=[err_col])
+    ax.hlines([warning_threshold, -warning_threshold], 0, 1, transform=trans, linestyles=[(0, (5, 10))], colors=[warn_col])
+
     for val, label, col, offset_val in thresholds:
-        # Draw the line at the exact threshold
-        ax.axhline(val, linestyle=(0, (5, 10)), color=col)
-        
         # Place text with an offset to prevent overlap
         # Using 'va' to push Error labels further away from Warning labels
         v_align = 'bottom' if val >= 0 else 'top'
@@ -378,80 +279,147 @@ def add_error_warning_lines(ax, variable):
                 fontsize=9, color=col, va=v_align, ha='left',
                 bbox=dict(facecolor='white', alpha=0.5, edgecolor='none', pad=1)) # Added a small white buffer
 
-    ax.legend()
+
+def _render_figure(figure, output_dir=None, file_name=None):
+    """
+    Render a figure to an in-memory RGB image, optionally also written to disk as PNG.
+    Args:
+        figure: Matplotlib figure to render.
+        output_dir: Directory to also write the PNG to (optional).
+        file_name: File name of the PNG in output_dir.
+    return: PIL image with the rendered pixels.
+    """
+    # Pillow is only needed once a plot is rendered, like matplotlib
+    from PIL import Image
+
+    # fpdf embeds the raw pixels, so encoding a PNG only to have fpdf decode it again is skipped;
+    # the figure is opaque and the alpha channel is dropped
+    figure.canvas.draw()
+    image = Image.fromarray(np.asarray(figure.canvas.buffer_rgba())).convert('RGB')
+    if output_dir is not None:
+        # the pixels are already rendered, so they are only encoded; plots compress well at a low level
+        image.save(Path(output_dir) / file_name, compress_level=_PNG_COMPRESS_LEVEL)
+    return image
+
+
+@functools.lru_cache(maxsize=None)
+def _darkest_color(group):
+    """
+    Get the darkest color of a colormap once per process, used for lines, arrows and legends.
+    Args:
+        group: 'ego' for the ego colormap, otherwise the colormap of the other vehicles.
+    return: RGBA tuple of the color.
+    """
+    colormap = Config.EGO_COLORMAP if group == 'ego' else Config.OTHER_COLORMAP
+    return colormap(255)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_figure(name):
+    """
+    Create the figure of one report plot once per process; it is rendered by Agg directly
+    (not owned by pyplot) and its axes are cleared for every report.
+    Args:
+        name: Name of the plot.
+    return: Figure and its axes.
+    """
+    # matplotlib is only imported once the first plot is made, reports of invalid files never need it
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    return figure, figure.add_subplot(111)
+
+
+def _get_cleared_figure(name):
+    """
+    Get the reused figure of a plot with empty axes.
+    Args:
+        name: Name of the plot.
+    return: Figure and its axes.
+    """
+    figure, ax = _get_figure(name)
+    ax.cla()
+    return figure, ax
+
 
 def plot_dynamics(checker, analyzed_dynamics, n_plot_entities=5, output_dir=None):
     """
-    Generate and save speed/acceleration/swim angle plots for a scenario.
+    Generate vehicle path and speed/acceleration/swim angle plots for a scenario.
     Args:
         checker: FileQualityChecker instance with scenario data.
         analyzed_dynamics: Dict with error/warning lists per variable.
         n_plot_entities: Max number of entities to show per plot.
-        output_dir: Directory to write PNG plots to.
+        output_dir: Directory to additionally write PNG plots to (optional).
+    return: Dict of plot name -> PIL image, empty if there is no dynamic data.
     """
     ylabel_speed = 'Speed [m/s]'
     ylabel_acceleration = 'Acceleration [m/s2]'
     ylabel_swimangle = 'Swim angle [rad]'
     xlabel = 'Time [s]'
-    # Output directory for generated PNG files (defaults to current directory)
-    output_dir = Path(output_dir) if output_dir else Path('.')
-	
+
+    # same peak test as check_dynamic_errors, imported here as quality_checker imports this module
+    from .quality_checker import _peak_square
+
     # Position and time data for all entities
     dynamic_data = checker._get_dynamic_data()
     if len(dynamic_data) == 0:
-        return
-    plot_vehicle_paths(dynamic_data, checker, save=True, output_dir=output_dir)
-    
-    speed_plot = plt.figure()
-    speed_ax = speed_plot.add_subplot(111)
-    acceleration_plot = plt.figure()
-    acceleration_ax = acceleration_plot.add_subplot(111)
-    swimangle_plot = plt.figure()
-    swimangle_ax = swimangle_plot.add_subplot(111)
-    
+        return {}
+    # Time series of all entities, computed once per checker
+    entity_series = checker._get_dynamic_series()
+    images = {'vehicle_paths': plot_vehicle_paths(entity_series, checker, save=True, output_dir=output_dir)}
+
+    speed_plot, speed_ax = _get_cleared_figure('speed')
+    acceleration_plot, acceleration_ax = _get_cleared_figure('acceleration')
+    swimangle_plot, swimangle_ax = _get_cleared_figure('swimangle')
+    # axis labels are set once per figure, the entities below only add their lines
+    for ax, ylabel in ((speed_ax, ylabel_speed), (acceleration_ax, ylabel_acceleration), (swimangle_ax, ylabel_swimangle)):
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+
     max_value_speed, max_value_acceleration, max_value_swimangle = 0, 0, 0
-    
-    # Build time series for each entity and plot the most relevant ones.
-    for entity_name in dynamic_data.keys():
-        positions, times = dynamic_data[entity_name]
-        df = checker._build_dynamic_data_df(positions, times)
-        df = checker._calculate_acceleration_swimangle(df)
 
+    # Plot the most relevant entities.
+    for entity_name, series in entity_series.items():
         if 'ego' in entity_name:
-            max_value_speed = plot_variable(speed_ax, df, 'speed', entity_name, xlabel, ylabel_speed, max_value_speed, save=False)
-            max_value_acceleration = plot_variable(acceleration_ax, df, 'acceleration', entity_name, xlabel, ylabel_acceleration, max_value_acceleration, save=False)
-            max_value_swimangle = plot_variable(swimangle_ax, df, 'swimangle', entity_name, xlabel, ylabel_swimangle, max_value_swimangle, save=False)
+            max_value_speed = plot_variable(speed_ax, series, 'speed', entity_name, max_value_speed, save=False)
+            max_value_acceleration = plot_variable(acceleration_ax, series, 'acceleration', entity_name, max_value_acceleration, save=False)
+            max_value_swimangle = plot_variable(swimangle_ax, series, 'swimangle', entity_name, max_value_swimangle, save=False)
         else:
-            # Only plot non-ego entities when thresholds are exceeded
-            if np.any(np.abs(df.acceleration) > Config.ACCELERATION_ERROR_THRESHOLD):
-                max_value_speed = plot_variable(speed_ax, df, 'speed', entity_name, xlabel, ylabel_speed, max_value_speed, save=False)
-                max_value_acceleration = plot_variable(acceleration_ax, df, 'acceleration', entity_name, xlabel, ylabel_acceleration, max_value_acceleration, save=False)
-            elif np.any(np.abs(df.acceleration) > Config.ACCELERATION_WARNING_THRESHOLD):
-                max_value_speed = plot_variable(speed_ax, df, 'speed', entity_name, xlabel, ylabel_speed, max_value_speed, save=False)
-                max_value_acceleration = plot_variable(acceleration_ax, df, 'acceleration', entity_name, xlabel, ylabel_acceleration, max_value_acceleration, save=False)
-
-            if np.any(np.abs(df.swimangle) > Config.SWIMANGLE_ERROR_THRESHOLD):
-                max_value_swimangle = plot_variable(swimangle_ax, df, 'swimangle', entity_name, xlabel, ylabel_swimangle, max_value_swimangle, save=False)
-            elif np.any(np.abs(df.swimangle) > Config.SWIMANGLE_WARNING_THRESHOLD):
-                max_value_swimangle = plot_variable(swimangle_ax, df, 'swimangle', entity_name, xlabel, ylabel_swimangle, max_value_swimangle, save=False)
-        # Close the current figure context to avoid resource leaks in long runs.
-        mpl.pyplot.close()
-        
+            # Only plot non-ego entities when thresholds are exceeded (errors exceed the warning thresholds as well)
+            acceleration_peak_sq = _peak_square(series.acceleration)
+            swimangle_peak_sq = _peak_square(series.swimangle)
+            if acceleration_peak_sq > Config.ACCELERATION_WARNING_THRESHOLD_SQ:
+                max_value_speed = plot_variable(speed_ax, series, 'speed', entity_name, max_value_speed, save=False)
+                max_value_acceleration = plot_variable(acceleration_ax, series, 'acceleration', entity_name, max_value_acceleration, save=False)
+
+            if swimangle_peak_sq > Config.SWIMANGLE_WARNING_THRESHOLD_SQ:
+                max_value_swimangle = plot_variable(swimangle_ax, series, 'swimangle', entity_name, max_value_swimangle, save=False)
+
+    # speed and acceleration share the entities selected by the acceleration issues
+    acceleration_extra_entities = select_extra_entities(dynamic_data, analyzed_dynamics["acceleration_errors"], analyzed_dynamics["acceleration_warnings"], n_plot_entities)
+    swimangle_extra_entities = select_extra_entities(dynamic_data, analyzed_dynamics["swimangle_errors"], analyzed_dynamics["swimangle_warnings"], n_plot_entities)
+
     speed_ax.set_title('Speed over time')
-    select_and_plot_extra_entities(dynamic_data, 'speed', speed_ax, analyzed_dynamics["acceleration_errors"], analyzed_dynamics["acceleration_warnings"], n_plot_entities, checker, xlabel=xlabel, ylabel=ylabel_speed, max_value=max_value_speed, save=False)
-    speed_plot.savefig(output_dir / 'speed_plot.png')
-    
+    plot_extra_entities(speed_ax, entity_series, acceleration_extra_entities, 'speed', max_value=max_value_speed, save=False)
+    speed_ax.legend()
+    images['speed'] = _render_figure(speed_plot, output_dir, 'speed_plot.png')
+
     # Acceleration
-    select_and_plot_extra_entities(dynamic_data, 'acceleration', acceleration_ax, analyzed_dynamics["acceleration_errors"], analyzed_dynamics["acceleration_warnings"], n_plot_entities, checker, xlabel=xlabel, ylabel=ylabel_acceleration, max_value=max_value_acceleration, save=False)
+    plot_extra_entities(acceleration_ax, entity_series, acceleration_extra_entities, 'acceleration', max_value=max_value_acceleration, save=False)
+    acceleration_ax.legend()
     acceleration_ax.set_title('Acceleration over time')
     add_error_warning_lines(acceleration_ax, 'acceleration')
-    acceleration_plot.savefig(output_dir / 'acceleration_plot.png')
-    
+    images['acceleration'] = _render_figure(acceleration_plot, output_dir, 'acceleration_plot.png')
+
     # Swim angle
-    select_and_plot_extra_entities(dynamic_data, 'swimangle', swimangle_ax, analyzed_dynamics["swimangle_errors"], analyzed_dynamics["swimangle_warnings"], n_plot_entities, checker, xlabel=xlabel, ylabel=ylabel_swimangle, max_value=max_value_swimangle, save=False)
+    plot_extra_entities(swimangle_ax, entity_series, swimangle_extra_entities, 'swimangle', max_value=max_value_swimangle, save=False)
+    swimangle_ax.legend()
     swimangle_ax.set_title('Swim angle over time')
     add_error_warning_lines(swimangle_ax, 'swimangle')
-    swimangle_plot.savefig(output_dir / 'swimangle_plot.png')
+    images['swimangle'] = _render_figure(swimangle_plot, output_dir, 'swimangle_plot.png')
+    return images
 
 
 def create_report_multiple(title, file_information, out_path, print_log=False):
@@ -466,13 +434,10 @@ def create_report_multiple(title, file_information, out_path, print_log=False):
         out_path: Output directory for the PDF.
         print_log: Whether to log the output path.
     """
-    title_separation = -5
-    subtitle_separation = -4
-    
     pdf = PDF(title)
     pdf.add_page()
 
-    pdf.create_textbox('Tests', relative_position=[0, title_separation], font=Config.PDF_FONT_TITLE)
+    pdf.create_textbox('Tests', relative_position=_POS_TITLE, font=Config.PDF_FONT_TITLE)
     # Header row uses manual spacing to align columns in a monospaced layout.
     pdf.create_textbox(
         ' ' * 10 + 'Scenario files'
@@ -480,28 +445,33 @@ def create_report_multiple(title, file_information, out_path, print_log=False):
         + ' ' * 12 + 'XSD valid'
         + ' ' * 10 + 'Simulation'
         + ' ' * 10 + 'File issues'
-        + ' ' * 8 + 'Dynamic issues', relative_position=[0, title_separation], font=Config.PDF_FONT_SUBTITLE)
+        + ' ' * 8 + 'Dynamic issues', relative_position=_POS_TITLE, font=Config.PDF_FONT_SUBTITLE)
     
+    # x positions of the row columns (mark, file name, xml, xsd, simulation, file issues, dynamic issues)
+    # in mm from the left margin, below the matching header labels
+    mark_x, name_x, xml_x, xsd_x, simulation_x, file_issues_x, dynamic_issues_x = (
+        pdf.l_margin + offset for offset in (3.92, 7.85, 78.46, 101.99, 116.12, 139.65, 160.83))
+
     # file = (path, xml_loadable, xsd_valid, simulation_status, n_file_issues, n_dynamic_issues)
     for file in file_information:
         if file[1] and file[2] and file[4] == 0 and file[5] == 0 and file[3] != 'failed':
-            pdf.create_textbox(text="     4", relative_position=[0, subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-            pdf.create_textbox('          ' + file[0].parts[-1], relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE_REGULAR)
-            pdf.create_textbox((" " * 100) + "4" * int(file[1]), relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-            pdf.create_textbox((" " * 130) + "4" * int(file[2]), relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-            pdf.create_textbox((" " * 148) + str(file[3]), relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE_REGULAR)
-            pdf.create_textbox((" " * 178) + str('0'), relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE_REGULAR)
-            pdf.create_textbox((" " * 205) + str('0'), relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE_REGULAR)
+            pdf.create_textbox(text="4", relative_position=_POS_SUBTITLE, font=Config.PDF_FONT_DING_SUB, x_position=mark_x)
+            pdf.create_textbox(file[0].parts[-1], relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_SUBTITLE_REGULAR, x_position=name_x)
+            pdf.create_textbox("4" * int(file[1]), relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_DING_SUB, x_position=xml_x)
+            pdf.create_textbox("4" * int(file[2]), relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_DING_SUB, x_position=xsd_x)
+            pdf.create_textbox(str(file[3]), relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_SUBTITLE_REGULAR, x_position=simulation_x)
+            pdf.create_textbox("0", relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_SUBTITLE_REGULAR, x_position=file_issues_x)
+            pdf.create_textbox("0", relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_SUBTITLE_REGULAR, x_position=dynamic_issues_x)
         else:
             # At least one check failed or issues are present.
-            pdf.create_textbox(text="     8", relative_position=[0, subtitle_separation], font=Config.PDF_FONT_DING_SUB, color=Config.ERROR_COLOR)
-            pdf.create_textbox(' ' * 10 + file[0].parts[-1], relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE_REGULAR)
-            pdf.create_textbox((" " * 100) + ("4" * int(file[1])) + ("8" * (1-int(file[1]))), relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_DING_SUB)
-            pdf.create_textbox((" " * 130) + ("4" * int(file[2])) + ("8" * (1-int(file[2]))), relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_DING_SUB)
+            pdf.create_textbox(text="8", relative_position=_POS_SUBTITLE, font=Config.PDF_FONT_DING_SUB, color=Config.ERROR_COLOR, x_position=mark_x)
+            pdf.create_textbox(file[0].parts[-1], relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_SUBTITLE_REGULAR, x_position=name_x)
+            pdf.create_textbox("4" if file[1] else "8", relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_DING_SUB, x_position=xml_x)
+            pdf.create_textbox("4" if file[2] else "8", relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_DING_SUB, x_position=xsd_x)
             sim_color = Config.ERROR_COLOR if file[3] == 'failed' else None
-            pdf.create_textbox((" " * 148) + str(file[3]), relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE_REGULAR, color=sim_color)
-            pdf.create_textbox((" " * 178) + str(file[4]), relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE_REGULAR)
-            pdf.create_textbox((" " * 205) + str(file[5]), relative_position=[0, 2*subtitle_separation], font=Config.PDF_FONT_SUBTITLE_REGULAR)
+            pdf.create_textbox(str(file[3]), relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_SUBTITLE_REGULAR, color=sim_color, x_position=simulation_x)
+            pdf.create_textbox(str(file[4]), relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_SUBTITLE_REGULAR, x_position=file_issues_x)
+            pdf.create_textbox(str(file[5]), relative_position=_POS_2SUBTITLE, font=Config.PDF_FONT_SUBTITLE_REGULAR, x_position=dynamic_issues_x)
         pdf.create_line(color=(0, 0, 0), relative_position=[0, -2])
 
     out = out_path / Path('aggregate_report.pdf' )
@@ -510,84 +480,84 @@ def create_report_multiple(title, file_information, out_path, print_log=False):
         logger.info(f'Report created: {out}')
 
 
-def plot_variable(ax, df, variable, entity_name, xlabel, ylabel, max_value=0, save=False):
+def plot_variable(ax, series, variable, entity_name, max_value=0, save=False):
     """
     Plot a single variable over time for one entity.
     Args:
         ax: Matplotlib Axes to draw on.
-        df: DataFrame containing time series data.
-        variable: Column name to plot.
+        series: DynamicSeries containing time series data.
+        variable: Field name to plot.
         entity_name: Entity identifier used in the legend.
-        xlabel: Label for the x-axis.
-        ylabel: Label for the y-axis.
         max_value: Current maximum value for y-axis scaling.
         save: Whether to save an individual plot image.
-    """
-    """
-    dedicated plotting style for dynamic variables
+    return: Updated maximum value for y-axis scaling.
     """
     # Use distinct colors and z-order so ego stands out visually.
+    values = getattr(series, variable)
     if 'ego' in entity_name:
-        ax.plot(df.time, df.loc[:, variable], label=entity_name, color=Config.EGO_COLORMAP(255), zorder=999)
+        ax.plot(series.time, values, label=entity_name, color=_darkest_color('ego'), zorder=999)
     else:
-        ax.plot(df.time, df.loc[:, variable], label=entity_name, color=Config.OTHER_COLORMAP(255), zorder=-1)
-        
-    max_value_local = df.loc[:, variable].abs().max()
+        ax.plot(series.time, values, label=entity_name, color=_darkest_color('other'), zorder=-1)
+
+    # nan samples are ignored, only nan samples never raise the maximum
+    max_value_local = np.nanmax(np.abs(values), initial=-np.inf)
     if max_value_local > max_value:
         max_value = max_value_local
     ax.set_ylim(-max_value*1.2, max_value*1.2)
 
-    # plt.title(str(variable) + ' over time for entity ' + entity_name)
-    ax.set_xlabel(xlabel)
-    ax.set_ylabel(ylabel)
     if save:
-        plt.savefig(str(variable) + '_' + entity_name + '.png')
-    # Close the global pyplot state to avoid accumulating figures.
-    mpl.pyplot.close()
-    
+        ax.figure.savefig(str(variable) + '_' + entity_name + '.png', pil_kwargs={'compress_level': _PNG_COMPRESS_LEVEL})
+
     return max_value
 
 
-def plot_fading_line(ax, df, label, zorder, segment_size=10, arrow_size=2, colormap=mpl.colormaps['Blues']):
+def fading_line_segments(series, segment_size=10, arrow_size=2, colormap=None):
     """
-    Plot a line that fades from light to dark along its path.
+    Split a trajectory into line segments that fade from light to dark along its path.
     Args:
-        ax: Matplotlib Axes to draw on.
-        df: DataFrame containing trajectory points.
-        label: Legend label for the line.
-        zorder: Z-order for drawing.
+        series: DynamicSeries containing trajectory points.
         segment_size: Number of points per color segment.
-        arrow_size: Number of segments for arrow placement.
-        colormap: Matplotlib colormap to sample from.
+        arrow_size: Number of segments for arrow placement, these are left out.
+        colormap: Matplotlib colormap to sample from (default: ego colormap).
+    return: List of (n, 2) point arrays and an array with the RGBA color of each segment.
     """
+    if colormap is None:
+        colormap = Config.EGO_COLORMAP
     # Split trajectory into segments that get progressively darker
-    n_segments = int(df.shape[0] / segment_size)
-    
-    for segment in range(n_segments - arrow_size + 1):
-        ax.plot(
-            df[segment * segment_size:(segment+1)*segment_size+1].x, 
-            df[segment * segment_size:(segment+1)*segment_size+1].y,
-            label=label,
-            c=colormap(int((255/n_segments))*segment),
-            zorder=zorder
-        )
-    mpl.pyplot.close()
+    n_segments = int(len(series.x) / segment_size)
+    n_plot_segments = n_segments - arrow_size + 1
+    if n_plot_segments < 1:
+        return [], np.empty((0, 4))
 
+    # consecutive segments share their end point, the last one is cut at the end of the track
+    points = np.column_stack((series.x, series.y))
+    segments = [points[start:start + segment_size + 1] for start in range(0, n_plot_segments * segment_size, segment_size)]
+    # colors spread over the whole colormap, the last plotted segment gets the darkest color
+    colors = colormap(np.linspace(0.0, 1.0, len(segments)))
+    return segments, colors
 
-def plot_vehicle_paths(dynamic_data, checker, segment_size=10, arrow_size=1, save=True, output_dir=None):
+
+def plot_vehicle_paths(entity_series, checker, segment_size=10, arrow_size=1, save=True, output_dir=None):
     """
     Plot 2D trajectories of all vehicles in the XY plane.
     Args:
-        dynamic_data: Dict of entity -> (positions, times).
+        entity_series: Dict of entity -> DynamicSeries.
         checker: FileQualityChecker instance for data helpers.
         segment_size: Number of points per faded segment.
         arrow_size: Number of segments used for arrow placement.
-        save: Whether to save the plot to disk.
-        output_dir: Directory to save the plot.
+        save: Whether to render the plot to PNG.
+        output_dir: Directory to additionally write the PNG to (optional).
+    return: PIL image of the plot, None if save is False.
     """
-    output_dir = Path(output_dir) if output_dir else Path('.')
-    paths_plot = plt.figure()
-    paths_ax = paths_plot.add_subplot(111)
+    # the figure is reused and cleared by the next report, so an unrendered plot would be thrown away
+    if not save:
+        return None
+
+    from matplotlib.collections import LineCollection, PatchCollection
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import FancyArrow
+
+    paths_plot, paths_ax = _get_cleared_figure('vehicle_paths')
 
     # draw background map if xodr is available
     try:
@@ -698,42 +668,57 @@ def plot_vehicle_paths(dynamic_data, checker, segment_size=10, arrow_size=1, sav
         except Exception:
             pass
     
-    # plot vehicle data
-    for entity_name in dynamic_data.keys():
-        positions, times = dynamic_data[entity_name]
-        df = checker._build_dynamic_data_df(positions, times)
-        df = checker._calculate_acceleration_swimangle(df)
-
+    # plot vehicle data, the ego and the other vehicles are each drawn as one line and one arrow collection
+    groups = {'ego': ([], [], []), 'other': ([], [], [])}
+    colormaps = {'ego': Config.EGO_COLORMAP, 'other': Config.OTHER_COLORMAP}
+    arrow_points = arrow_size * segment_size
+    for entity_name, series in entity_series.items():
         # Skip very short trajectories that cannot render the arrow segment.
-        if df.shape[0] < arrow_size * segment_size:
+        if series.x.size < arrow_points:
             continue
         
-        if 'ego' in entity_name:
-            plot_fading_line(paths_ax, df, label='ego vehicle', segment_size=segment_size, arrow_size=arrow_size, colormap=Config.EGO_COLORMAP, zorder=999)
-            paths_ax.arrow(df.iloc[-arrow_size*segment_size].x, df.iloc[-arrow_size*segment_size].y, 
-                           df.iloc[-1].x - df.iloc[-arrow_size*segment_size].x, df.iloc[-1].y - df.iloc[-arrow_size*segment_size].y, 
-                           head_width=0.8, head_length=2, length_includes_head=True, color=Config.EGO_COLORMAP(255), zorder=999)
-        else:
-            plot_fading_line(paths_ax, df, label='other', segment_size=segment_size, arrow_size=arrow_size, colormap=Config.OTHER_COLORMAP, zorder=-1)
-            paths_ax.arrow(df.iloc[-arrow_size*segment_size].x, df.iloc[-arrow_size*segment_size].y, 
-                           df.iloc[-1].x - df.iloc[-arrow_size*segment_size].x, df.iloc[-1].y - df.iloc[-arrow_size*segment_size].y, 
-                           head_width=0.8, head_length=2, length_includes_head=True, color=Config.OTHER_COLORMAP(255), zorder=-1)
-
-    # Manual legend entries to match the two color categories.
-    legend_elements = [Line2D([0], [0], color=Config.EGO_COLORMAP(255), label='ego vehicle'),
-                    Line2D([0], [0], color=Config.OTHER_COLORMAP(255), label='other vehicles')]
-    paths_ax.legend(handles=legend_elements)
+        group = 'ego' if 'ego' in entity_name else 'other'
+        segments, colors, arrows = groups[group]
+        entity_segments, entity_colors = fading_line_segments(series, segment_size=segment_size, arrow_size=arrow_size,
+                                                              colormap=colormaps[group])
+        segments.extend(entity_segments)
+        colors.append(entity_colors)
+
+        # the arrow covers the last arrow_size segments, which the fading line leaves out
+        arrow_x, arrow_y = series.x[-arrow_points], series.y[-arrow_points]
+        arrows.append(FancyArrow(arrow_x, arrow_y, series.x[-1] - arrow_x, series.y[-1] - arrow_y,
+                                 head_width=0.8, head_length=2, length_includes_head=True, color=_darkest_color(group)))
+        # legend placement only looks at lines and patches, not at collections, so the path is also added as
+        # an invisible line the legend keeps clear of
+        paths_ax.add_line(Line2D(series.x, series.y, visible=False))
+
+    for group, (segments, colors, arrows) in groups.items():
+        zorder = 999 if group == 'ego' else -1
+        if segments:
+            # cap and join style of plotted lines, so the segments connect seamlessly
+            # no label, the legend of the paths plot is built from proxy artists
+            paths_ax.add_collection(LineCollection(segments, colors=np.concatenate(colors), zorder=zorder,
+                                                   capstyle='projecting', joinstyle='round'))
+        if arrows:
+            paths_ax.add_collection(PatchCollection(arrows, match_original=True, zorder=zorder))
+    # collections only extend the data limits, the view is not rescaled by themselves
+    paths_ax.autoscale_view()
+
+    # Manual legend entries to match the color categories, only for categories that were drawn.
+    legend_labels = {'ego': 'ego vehicle', 'other': 'other vehicles'}
+    legend_elements = [Line2D([0], [0], color=_darkest_color(group), label=legend_labels[group])
+                       for group, (_, _, arrows) in groups.items() if arrows]
+    if legend_elements:
+        paths_ax.legend(handles=legend_elements)
     paths_ax.set_xlabel('X [m]')
     paths_ax.set_ylabel('Y [m]')
     paths_ax.set_aspect('equal', adjustable='box')
     paths_ax.set_title('Vehicle paths')
 
-    if save:
-        paths_plot.savefig(output_dir / 'vehicle_paths.png')
-    mpl.pyplot.close()
+    return _render_figure(paths_plot, output_dir, 'vehicle_paths.png')
 
 
-def select_and_plot_extra_entities(dynamic_data, variable, ax, entities_errors, entities_warnings, n_plot_entities, checker, xlabel, ylabel, max_value=0, save=False):
+def select_extra_entities(dynamic_data, entities_errors, entities_warnings, n_plot_entities):
     """
     Select additional entities to plot when too few have issues.
 
@@ -741,29 +726,31 @@ def select_and_plot_extra_entities(dynamic_data, variable, ax, entities_errors,
     preferencing ego entities and those with errors or warnings.
     Args:
         dynamic_data: Dict of entity -> (positions, times).
-        variable: Variable name to plot.
-        ax: Matplotlib Axes to draw on.
         entities_errors: Entities with error-level violations.
         entities_warnings: Entities with warning-level violations.
         n_plot_entities: Max number of entities to plot.
-        checker: FileQualityChecker instance for data helpers.
-        xlabel: Label for the x-axis.
-        ylabel: Label for the y-axis.
-        save: Whether to save an individual plot image.
+    return: List of the additional entity names.
     """
-    # Initial set: ego entities plus those with errors or warnings.
-    plot_entities = [entity_name for entity_name in list(dynamic_data.keys()) if 'ego_' in entity_name] + entities_errors + entities_warnings
-    plot_entities = list(set(plot_entities))
+    # Initial set: ego entities plus those with errors or warnings (deduplicated, in order).
+    plot_entities = dict.fromkeys([entity_name for entity_name in dynamic_data if 'ego_' in entity_name] + entities_errors + entities_warnings)
     extra_plot_entities = []
-    # Fill up with additional entities if we have fewer than requested.
+    # Fill up with additional entities if we have fewer than requested, in scenario order so plots are reproducible.
     if len(plot_entities) < n_plot_entities:
-        extra_plot_entities = list(set(list(dynamic_data.keys())).difference(set(plot_entities)))
+        extra_plot_entities = [entity_name for entity_name in dynamic_data if entity_name not in plot_entities]
         extra_plot_entities = extra_plot_entities[:n_plot_entities-len(plot_entities)]
-    
+    return extra_plot_entities
+
+
+def plot_extra_entities(ax, entity_series, extra_plot_entities, variable, max_value=0, save=False):
+    """
+    Plot one variable of the additional entities.
+    Args:
+        ax: Matplotlib Axes to draw on.
+        entity_series: Dict of entity -> DynamicSeries.
+        extra_plot_entities: Entity names from select_extra_entities.
+        variable: Variable name to plot.
+        max_value: Current maximum value for y-axis scaling.
+        save: Whether to save an individual plot image.
+    """
     for entity_name in extra_plot_entities:
-        positions, times = dynamic_data[entity_name]
-        df = checker._build_dynamic_data_df(positions, times)
-        df = checker._calculate_acceleration_swimangle(df)
-        max_value = plot_variable(ax, df, variable, entity_name, xlabel, ylabel, max_value=max_value, save=save)
-        
-    ax.legend()
+        max_value = plot_variable(ax, entity_series[entity_name], variable, entity_name, max_value=max_value, save=save)
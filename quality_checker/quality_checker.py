@@ -1,40 +1,118 @@
 
 from collections import Counter
 import collections
+from concurrent.futures import ProcessPoolExecutor
 import csv
+import functools
 import io
 from datetime import datetime
 from loguru import logger
 import numpy as np
+import operator
 import os
-import collections
-import pandas as pd
 from pathlib import Path
-import tempfile
+import re
 import subprocess
-import shlex
 import shutil
-from scenariogeneration import xosc
-import scipy as sp
 import shapely
 import typer
 
-from xml.sax.handler import ContentHandler
-from xml.sax import make_parser
 import xml.etree.ElementTree as ET
-import xmlschema
 
 from .config import Config
-from .pdf import *
-from .pdf_report_creator import *
+from .pdf_report_creator import create_report_multiple, create_report_single
 from .xodr_position_resolver import OpenDrivePositionResolver
 
 # Default schema path relative to the package location
 DEFAULT_SCHEMA_PATH = Path(__file__).parent.parent / "schemas"
 
+# trajectory of one entity as float arrays, the derived values are filled by _calculate_acceleration_swimangle
+DynamicSeries = collections.namedtuple('DynamicSeries', ['time', 'x', 'y', 'h', 'speed', 'acceleration', 'swimangle'],
+                                       defaults=(None, None, None))
+
 app = typer.Typer()
 
 
+def _centered_rolling_mean(values, window):
+    """
+    Centered rolling mean, nan where the window is not complete or contains nan.
+    Args:
+        values: 1d float array.
+        window: Number of samples per window.
+    return: Array of the same length as values.
+    """
+    result = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        means = np.lib.stride_tricks.sliding_window_view(values, window).mean(axis=1)
+        # window of sample i reaches from i - window // 2 to i + (window - 1) // 2
+        result[window // 2:window // 2 + len(means)] = means
+    return result
+
+
+def _peak_square(values):
+    """
+    Square of the largest absolute value, nan samples are ignored.
+    Args:
+        values: 1d float array.
+    return: Peak of the squared values, 0 for empty or all-nan arrays.
+    """
+    # two in-place reductions instead of materializing the squared array
+    peak = max(np.nanmax(values, initial=0.0), -np.nanmin(values, initial=0.0))
+    return peak * peak
+
+
+def _fill_forward(values):
+    """
+    Replace nan values with the last valid value before them.
+    Args:
+        values: 1d float array.
+    return: Filled array, leading nan values are kept.
+    """
+    index = np.where(np.isnan(values), 0, np.arange(len(values)))
+    np.maximum.accumulate(index, out=index)
+    return values[index]
+
+
+def _fill_backward(values):
+    """
+    Replace nan values with the next valid value after them.
+    Args:
+        values: 1d float array.
+    return: Filled array, trailing nan values are kept.
+    """
+    return _fill_forward(values[::-1])[::-1]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_schema(schema_file):
+    """
+    Load an XSD schema once per process, building it takes much longer than validating a file.
+    Args:
+        schema_file: Resolved path of the XSD file.
+    return: xmlschema.XMLSchema of the file.
+    """
+    # xmlschema and scenariogeneration are imported on first use, files that are no XML never need them
+    import xmlschema
+
+    return xmlschema.XMLSchema(str(schema_file))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_lxml_schema(schema_file):
+    """
+    Load an XSD schema into libxml2's compiled validator, much faster than xmlschema for the validity check.
+    Args:
+        schema_file: Resolved path of the XSD file.
+    return: lxml.etree.XMLSchema of the file, None if libxml2 cannot build it.
+    """
+    from lxml import etree
+
+    try:
+        return etree.XMLSchema(etree.parse(str(schema_file)))
+    except (etree.XMLSchemaParseError, etree.XMLSyntaxError, OSError):
+        return None
+
+
 class FileQualityChecker:
     def __init__(self, scenario_path, schema_path, esmini_path=None, print_log=False):
         """
@@ -61,6 +139,8 @@ class FileQualityChecker:
         self.position_resolution_warnings = []
         self.dynamic_errors = None
         self.dynamic_data = None
+        self.dynamic_series = None
+        self.xml_tree = None
         self.simulation_status = 'not done'
         self._xodr_resolver = OpenDrivePositionResolver()
 
@@ -132,15 +212,18 @@ class FileQualityChecker:
 
     def is_xml_loadable(self):
         """
-        Check whether the file can be parsed as XML.
+        Check whether the file can be parsed as XML, the parsed tree is kept for the later checks.
         Args:
             None
         return: True if the file parses as XML, otherwise False.
         """
-        parser = make_parser()
-        parser.setContentHandler(ContentHandler())
+        from lxml import etree
+
+        # the file is parsed once, with lxml so the tree can be validated without reading it again;
+        # comments and processing instructions are dropped like ElementTree does, root[0] stays the FileHeader
+        parser = etree.XMLParser(resolve_entities=False, remove_comments=True, remove_pis=True, collect_ids=False)
         try:
-            parser.parse(self.file_path)
+            self.xml_tree = etree.parse(str(self.file_path), parser)
             return True
         except Exception as e:
             return False
@@ -152,8 +235,7 @@ class FileQualityChecker:
             schema_path: Path to the directory with XSD schemas.
         return: (is_valid, xsd_version)
         """
-        tree = ET.parse(self.file_path)
-        root = tree.getroot()
+        root = self.xml_tree.getroot()
 
         revMajor = root[0].attrib['revMajor']
         revMinor = root[0].attrib['revMinor']
@@ -180,35 +262,51 @@ class FileQualityChecker:
                 logger.error(msg)
             return (False, xsd_version)
 
-        xsd = xmlschema.XMLSchema(schema_file)
-        is_valid = xsd.is_valid(self.file_path)
+        schema_file = Path(schema_file).resolve()
+        schema = _load_lxml_schema(schema_file)
+        if schema is None:
+            msg = f"Schema file for version {xsd_version} could not be loaded: {schema_file}"
+            self.xsd_errors.append(msg)
+            if self.print_log:
+                logger.error(msg)
+            return (False, xsd_version)
+
+        # lxml is the authority on validity, xmlschema only provides the error texts of rejected files
+        if schema.validate(self.xml_tree):
+            return (True, xsd_version)
 
-        # If validation fails, collect and log detailed errors.
-        if not is_valid:
-            try:
-                # Limit the number of stored errors to keep PDFs readable.
-                max_errors = 20
-                for idx, error in enumerate(xsd.iter_errors(self.file_path)):
-                    if idx >= max_errors:
-                        more_msg = f"... and more XSD errors (showing first {max_errors})."
-                        self.xsd_errors.append(more_msg)
-                        if self.print_log:
-                            logger.error(more_msg)
-                        break
-                    # Build a concise description including path and message.
-                    err_msg = f"{error.path}: {error.message}"
-                    self.xsd_errors.append(err_msg)
+        try:
+            xsd = _load_schema(schema_file)
+            # Limit the number of stored errors to keep PDFs readable.
+            max_errors = 20
+            for idx, error in enumerate(xsd.iter_errors(self.xml_tree)):
+                if idx >= max_errors:
+                    more_msg = f"... and more XSD errors (showing first {max_errors})."
+                    self.xsd_errors.append(more_msg)
                     if self.print_log:
-                        logger.error(
-                            f"XSD validation error in {self.file_path} (version {xsd_version}): {err_msg}"
-                        )
-            except Exception as e:
-                fallback_msg = f"Failed to collect XSD validation errors for {self.file_path}: {e}"
-                self.xsd_errors.append(fallback_msg)
+                        logger.error(more_msg)
+                    break
+                # Build a concise description including path and message.
+                err_msg = f"{error.path}: {error.message}"
+                self.xsd_errors.append(err_msg)
                 if self.print_log:
-                    logger.error(fallback_msg)
+                    logger.error(
+                        f"XSD validation error in {self.file_path} (version {xsd_version}): {err_msg}"
+                    )
+        except Exception as e:
+            fallback_msg = f"Failed to collect XSD validation errors for {self.file_path}: {e}"
+            self.xsd_errors.append(fallback_msg)
+            if self.print_log:
+                logger.error(fallback_msg)
 
-        return (is_valid, xsd_version)
+        # xmlschema may accept what libxml2 rejects, the file then keeps lxml's own message
+        if not self.xsd_errors:
+            err_msg = str(schema.error_log.last_error)
+            self.xsd_errors.append(err_msg)
+            if self.print_log:
+                logger.error(f"XSD validation error in {self.file_path} (version {xsd_version}): {err_msg}")
+
+        return (False, xsd_version)
 
     def load_openscenario(self):
         """
@@ -217,40 +315,32 @@ class FileQualityChecker:
             None
         return: Parsed scenariogeneration object or None on failure.
         """
-        temp_file = self._process_xosc_file()
-        try:
-            scenario = xosc.ParseOpenScenario(temp_file)
-            return scenario
-        finally:
-            # cleanup temp file
-            temp_path = Path(temp_file)
-            if temp_path.exists():
-                temp_path.unlink()
-
-    def _process_xosc_file(self):
+        from scenariogeneration import xosc
+
+        # parsed from memory with the parsers ParseOpenScenario dispatches to; ParseOpenScenario needs
+        # a file and validates it against the schema again, which is_xsd_valid has already done
+        loaded_xosc = ET.ElementTree(ET.fromstring(self._process_xosc_content()))
+        if loaded_xosc.find("ParameterValueDistribution") is not None:
+            return xosc.ParameterValueDistribution.parse(loaded_xosc)
+        elif loaded_xosc.find("Catalog") is not None:
+            return xosc.Catalog.parse(loaded_xosc)
+        elif loaded_xosc.find("Storyboard") is not None:
+            return xosc.Scenario.parse(loaded_xosc)
+        raise xosc.NotAValidElement("The provided file is not on a OpenSCENARIO compatible format.")
+
+    def _process_xosc_content(self):
         """
-        Create a temp .xosc with parameter placeholders resolved.
+        Read the .xosc content with parameter placeholders resolved.
         Args:
             None
-        return: Path to the temporary .xosc file.
+        return: Content of the scenario file with the parameter values filled in.
         """
         parameters = self._load_parameter_declarations_outside_storyboard()
 
         with open(self.file_path, 'r', encoding='utf-8') as file:
             content = file.read()
 
-        updated_content = self._replace_parameters_in_content(content, parameters)
-
-        # Write the processed scenario into the persistent results/tmp folder
-        # to avoid OS-level temp paths that might be hard to inspect.
-        project_root = Path.cwd()
-        tmp_root = project_root / "results" / "tmp"
-        tmp_root.mkdir(parents=True, exist_ok=True)
-
-        temp_path = tmp_root / f"processed_{Path(self.file_path).name}"
-        with open(temp_path, mode="w", encoding="utf-8") as temp:
-            temp.write(updated_content)
-        return temp_path
+        return self._replace_parameters_in_content(content, parameters)
     
     def get_date(self):
         """
@@ -259,8 +349,7 @@ class FileQualityChecker:
             None
         return: Date string in DD.MM.YYYY format or None.
         """
-        tree = ET.parse(self.file_path)
-        root = tree.getroot()
+        root = self.xml_tree.getroot()
         header = root.find("FileHeader")
         if header is not None and 'date' in header.attrib:
             date = header.attrib['date']
@@ -317,6 +406,7 @@ class FileQualityChecker:
         dynamic_data = self._get_dynamic_data()
         if len(dynamic_data) == 0:
             return (acceleration_errors, acceleration_warnings, swimangle_errors, swimangle_warnings)
+        dynamic_series = self._get_dynamic_series()
 
         for entity_name in dynamic_data.keys():
             positions, times = dynamic_data[entity_name]
@@ -324,34 +414,37 @@ class FileQualityChecker:
             if len(times) == 0 or any(t is None for t in times):
                 continue
             
-            df = self._build_dynamic_data_df(positions, times)
-            df = self._calculate_acceleration_swimangle(df)
-
-            if 'ego' in entity_name:
-                if np.any(np.abs(df.acceleration) > Config.ACCELERATION_ERROR_THRESHOLD):
-                    acceleration_errors.append(entity_name)
-                elif np.any(np.abs(df.acceleration) > Config.ACCELERATION_WARNING_THRESHOLD):
-                    acceleration_warnings.append(entity_name)
-
-                if np.any(np.abs(df.swimangle) > Config.SWIMANGLE_ERROR_THRESHOLD):
-                    swimangle_errors.append(entity_name)
-                elif np.any(np.abs(df.swimangle) > Config.SWIMANGLE_WARNING_THRESHOLD):
-                    swimangle_warnings.append(entity_name)
-            else:
-                if np.any(np.abs(df.acceleration) > Config.ACCELERATION_ERROR_THRESHOLD):
-                    acceleration_errors.append(entity_name)
-                elif np.any(np.abs(df.acceleration) > Config.ACCELERATION_WARNING_THRESHOLD):
-                    acceleration_warnings.append(entity_name)
-                if np.any(np.abs(df.swimangle) > Config.SWIMANGLE_ERROR_THRESHOLD):
-                    swimangle_errors.append(entity_name)
-                elif np.any(np.abs(df.swimangle) > Config.SWIMANGLE_WARNING_THRESHOLD):
-                    swimangle_warnings.append(entity_name)
-            
+            series = dynamic_series[entity_name]
+
+            acceleration_peak_sq = _peak_square(series.acceleration)
+            swimangle_peak_sq = _peak_square(series.swimangle)
+
+            if acceleration_peak_sq > Config.ACCELERATION_ERROR_THRESHOLD_SQ:
+                acceleration_errors.append(entity_name)
+            elif acceleration_peak_sq > Config.ACCELERATION_WARNING_THRESHOLD_SQ:
+                acceleration_warnings.append(entity_name)
+
+            if swimangle_peak_sq > Config.SWIMANGLE_ERROR_THRESHOLD_SQ:
+                swimangle_errors.append(entity_name)
+            elif swimangle_peak_sq > Config.SWIMANGLE_WARNING_THRESHOLD_SQ:
+                swimangle_warnings.append(entity_name)
+
         return (
             acceleration_errors, acceleration_warnings, 
             swimangle_errors, swimangle_warnings
             )
     
+    def _iter_maneuvergroups(self):
+        """
+        Iterate over the maneuver groups of all stories and acts.
+        Args:
+            None
+        return: Generator of maneuver groups in storyboard order.
+        """
+        for story in self.scenario.storyboard.stories:
+            for act in story.acts:
+                yield from act.maneuvergroup
+
     def _get_dynamic_data(self):
         """
         Return positions and times for each actor's trajectory events.
@@ -384,37 +477,50 @@ class FileQualityChecker:
         self.dynamic_data = self._get_dynamic_data_from_scenario()
         return self.dynamic_data
 
+    def _get_dynamic_series(self):
+        """
+        Return speed, acceleration and swim angle over time for each actor's trajectory.
+        return: Dict mapping entity name to DynamicSeries.
+        """
+        # Make sure that calculation is only done once, the checks and all plots use the same series.
+        if self.dynamic_series is not None:
+            return self.dynamic_series
+
+        self.dynamic_series = {}
+        for entity_name, (positions, times) in self._get_dynamic_data().items():
+            series = self._build_dynamic_data_arrays(positions, times)
+            self.dynamic_series[entity_name] = self._calculate_acceleration_swimangle(series)
+        return self.dynamic_series
+
     def _get_dynamic_data_from_scenario(self):
         """Extract dynamic data directly from scenario trajectory/route actions."""
         dynamic_data = {}
 
-        for story in self.scenario.storyboard.stories:
-            for act in story.acts:
-                for maneuvergroup in act.maneuvergroup:
-                    # Per definition only one actor per maneuver group.
-                    actor_name = maneuvergroup.actors.actors[0].entity
-
-                    for maneuver in maneuvergroup.maneuvers:
-                        for event in maneuver.events:
-                            for action in event.action:
-                                if 'trajectory' in dir(action.action):
-                                    times = action.action.trajectory.shapes.time
-                                    positions = action.action.trajectory.shapes.positions
-                                    if actor_name in dynamic_data:
-                                        old_positions, old_times = dynamic_data[actor_name]
-                                        dynamic_data[actor_name] = (old_positions + positions, old_times + times)
-                                    else:
-                                        dynamic_data[actor_name] = (positions, times)
-                                elif 'route' in dir(action.action):
-                                    positions = [waypoint.position for waypoint in action.action.route.waypoints]
-                                    times = [None] * len(positions)
-                                    if actor_name in dynamic_data:
-                                        old_positions, old_times = dynamic_data[actor_name]
-                                        dynamic_data[actor_name] = (old_positions + positions, old_times + times)
-                                    else:
-                                        dynamic_data[actor_name] = (positions, times)
-                                else:
-                                    pass
+        for maneuvergroup in self._iter_maneuvergroups():
+            # Per definition only one actor per maneuver group.
+            actor_name = maneuvergroup.actors.actors[0].entity
+
+            for maneuver in maneuvergroup.maneuvers:
+                for event in maneuver.events:
+                    for action in event.action:
+                        if 'trajectory' in dir(action.action):
+                            times = action.action.trajectory.shapes.time
+                            positions = action.action.trajectory.shapes.positions
+                            if actor_name in dynamic_data:
+                                old_positions, old_times = dynamic_data[actor_name]
+                                dynamic_data[actor_name] = (old_positions + positions, old_times + times)
+                            else:
+                                dynamic_data[actor_name] = (positions, times)
+                        elif 'route' in dir(action.action):
+                            positions = [waypoint.position for waypoint in action.action.route.waypoints]
+                            times = [None] * len(positions)
+                            if actor_name in dynamic_data:
+                                old_positions, old_times = dynamic_data[actor_name]
+                                dynamic_data[actor_name] = (old_positions + positions, old_times + times)
+                            else:
+                                dynamic_data[actor_name] = (positions, times)
+                        else:
+                            pass
 
         return dynamic_data
 
@@ -431,7 +537,8 @@ class FileQualityChecker:
         tmp_root = project_root / "results" / "tmp"
         tmp_root.mkdir(parents=True, exist_ok=True)
 
-        scenario_tmp = tmp_root / "scenario_for_esmini.xosc"
+        # file names are unique per scenario, so several files can be simulated in parallel
+        scenario_tmp = tmp_root / f"{Path(self.file_path).stem}_for_esmini.xosc"
         shutil.copy2(self.file_path, scenario_tmp)
 
         # Optionally adjust RoadNetwork -> LogicFile so that any referenced
@@ -485,7 +592,7 @@ class FileQualityChecker:
             # to the plain copied scenario file.
             pass
 
-        log_file = tmp_root / "esmini_log.csv"
+        log_file = tmp_root / f"{Path(self.file_path).stem}_esmini_log.csv"
 
         cmd = [
             self.esmini_path,
@@ -528,7 +635,7 @@ class FileQualityChecker:
                 scenario_tmp.unlink()
             if log_file.exists():
                 log_file.unlink()
-            # Remove tmp_root only when it is empty; ignore errors if not.
+            # Remove tmp_root only when it is empty; rmdir fails while another worker still has files in it.
             try:
                 tmp_root.rmdir()
             except OSError:
@@ -546,11 +653,9 @@ class FileQualityChecker:
         directory. If the referenced file exists, its absolute Path is
         returned; otherwise, None is returned.
         """
-        try:
-            tree = ET.parse(self.file_path)
-            root = tree.getroot()
-        except Exception:
+        if self.xml_tree is None:
             return None
+        root = self.xml_tree.getroot()
 
         road_network = root.find("RoadNetwork")
         if road_network is None:
@@ -700,20 +805,14 @@ class FileQualityChecker:
             None
         return: Dict of parameter name to value.
         """
-        tree = ET.parse(self.file_path)
-        root = tree.getroot()
+        root = self.xml_tree.getroot()
 
         parameters = {}
-        storyboard = root.find('.//Storyboard')
-        all_parameters = root.findall('.//ParameterDeclaration')
-
-        if storyboard is not None:
-            storyboard_parameters = set(storyboard.findall('.//ParameterDeclaration'))
-        else:
-            storyboard_parameters = set()
-
-        for param in all_parameters:
-            if param not in storyboard_parameters:
+        # one pass in document order, the Storyboard is a direct child of the root in valid files and skipped
+        for child in root:
+            if child.tag == 'Storyboard':
+                continue
+            for param in child.iter('ParameterDeclaration'):
                 name = param.get('name')
                 value = param.get('value')
                 parameters[name] = value
@@ -729,10 +828,13 @@ class FileQualityChecker:
             parameters: Dict of parameter name to value.
         return: Updated content string.
         """
-        for name, value in parameters.items():
-            placeholder = f'${name}'
-            content = content.replace(placeholder, value)
-        return content
+        if len(parameters) == 0:
+            return content
+        # one pass over the content, longer names first so a name that is a prefix of another one
+        # does not replace the start of the longer placeholder
+        names = sorted(parameters, key=len, reverse=True)
+        pattern = re.compile(r'\$(' + '|'.join(map(re.escape, names)) + ')')
+        return pattern.sub(lambda match: parameters[match.group(1)], content)
 
     def _check_actors_defined(self, entity_names):
         """
@@ -741,16 +843,16 @@ class FileQualityChecker:
             entity_names: List of entities defined in the scenario.
         return: List of missing entity definitions.
         """
+        from scenariogeneration import xosc
+
         missing_entity_definitions = []
 
-        for story in self.scenario.storyboard.stories:
-            for act in story.acts:
-                for maneuvergroup in act.maneuvergroup:
-                    actors = {actor.entity for actor in maneuvergroup.actors.actors if '$' not in actor.entity}
+        for maneuvergroup in self._iter_maneuvergroups():
+            actors = {actor.entity for actor in maneuvergroup.actors.actors if '$' not in actor.entity}
 
-                    if len(actors.intersection(set(entity_names))) != len(actors):
-                        missing_entity_definition = list(set(actors) - set(entity_names))
-                        missing_entity_definitions.append(missing_entity_definition)
+            if len(actors.intersection(set(entity_names))) != len(actors):
+                missing_entity_definition = list(set(actors) - set(entity_names))
+                missing_entity_definitions.append(missing_entity_definition)
 
         missing_entity_definitions = [x for xs in missing_entity_definitions for x in xs]
 
@@ -761,7 +863,7 @@ class FileQualityChecker:
                 continue
 
             for initaction in initactions:
-                if 'AbsoluteSpeedAction' in str(type(initaction)) and not isinstance(initaction.speed, float):
+                if isinstance(initaction, xosc.AbsoluteSpeedAction) and not isinstance(initaction.speed, float):
                     missing_entity_definitions.append(entity)
 
         return list(set(missing_entity_definitions))
@@ -773,16 +875,13 @@ class FileQualityChecker:
             None
         return: Dict of entity name to type (or None if unavailable).
         """
-        # Prefer typed vehicle info when available, fall back to names only.
+        # Prefer typed vehicle info when available, objects without it (e.g. pedestrians) get None.
         entities = {}
 
-        try:
-            for scenario_object in self.scenario.entities.scenario_objects:
-                entities[scenario_object.name] = scenario_object.entityobject.vehicle_type.name
-            return entities
-        except AttributeError:
-            entity_list = [scenario_object.name for scenario_object in self.scenario.entities.scenario_objects]
-            return dict.fromkeys(entity_list)
+        for scenario_object in self.scenario.entities.scenario_objects:
+            vehicle_type = getattr(getattr(scenario_object, 'entityobject', None), 'vehicle_type', None)
+            entities[scenario_object.name] = vehicle_type.name if vehicle_type is not None else None
+        return entities
 
     def _get_initial_positions(self, entity_names):
         """
@@ -791,6 +890,8 @@ class FileQualityChecker:
             entity_names: List of entity names to inspect.
         return: (init_positions_dict, parked_entities_list, unresolved_no_xodr_list, unresolved_conversion_list)
         """
+        from scenariogeneration import xosc
+
         # Position is taken from TeleportAction; parked if speed is ~0.
         init_positions = {}
         parked_entities = []
@@ -807,10 +908,10 @@ class FileQualityChecker:
                 continue
 
             for initaction in initactions:
-                if 'TeleportAction' in str(type(initaction)):
-                    if 'WorldPosition' in str(type(initaction.position)):
+                if isinstance(initaction, xosc.TeleportAction):
+                    if isinstance(initaction.position, xosc.WorldPosition):
                         init_positions[entity] = (initaction.position.x, initaction.position.y)
-                    elif 'LanePosition' in str(type(initaction.position)):
+                    elif isinstance(initaction.position, (xosc.LanePosition, xosc.RelativeLanePosition)):
                         if has_valid_xodr:
                             world_position = self._resolve_lane_position_to_world(initaction.position)
                             if world_position is not None:
@@ -823,7 +924,7 @@ class FileQualityChecker:
                             unresolved_no_xodr.append(entity)
                     else:
                         init_positions[entity] = ('-', '-')
-                elif 'AbsoluteSpeedAction' in str(type(initaction)):
+                elif isinstance(initaction, xosc.AbsoluteSpeedAction):
                     if isinstance(initaction.speed, float) and initaction.speed < 1e-6:
                         parked_entities.append(entity)
 
@@ -850,69 +951,44 @@ class FileQualityChecker:
             init_positions: Dict of entity name to (x, y).
         return: List of entity groups with identical positions.
         """
-        # Detect duplicate positions by counting identical tuples.
-        identical_position_entities = []
-
+        # Group the entities by position in one pass, groups keep the order of the entities.
         valid_positions = {k: v for k, v in init_positions.items() if FileQualityChecker._is_numeric_position(v)}
 
-        if len(set(valid_positions.values())) != len(valid_positions.values()):
-            Counter(valid_positions.values()).items()
-            duplicates = [
-                (i, item, count)
-                for i, (item, count) in enumerate(Counter(valid_positions.values()).items())
-                if count > 1
-            ]
-
-            for idx, item, count in duplicates:
-                idxs = [idx]
-                current_idx = idx
-                for _ in range(count - 1):
-                    idx_new = current_idx + list(valid_positions.values())[current_idx + 1 :].index(item) + 1
-                    idxs.append(idx_new)
-                    current_idx = idx_new
-
-                identical_position = [list(valid_positions.keys())[pos] for pos in idxs]
-                identical_position_entities.append(identical_position)
+        entities_by_position = collections.defaultdict(list)
+        for entity_name, position in valid_positions.items():
+            entities_by_position[position].append(entity_name)
+
+        identical_position_entities = [entities for entities in entities_by_position.values() if len(entities) > 1]
 
         return identical_position_entities
 
-    def _get_intersecting_entities(self, init_positions, filter_by_radius=True):
+    def _get_intersecting_entities(self, init_positions):
         """
         Check if entities intersect using initial positions and bounding boxes.
         Args:
             init_positions: Dict of entity name to (x, y).
-            filter_by_radius: Whether to prefilter by max radius.
         return: List of intersecting entity pairs.
         """
-        # Optional radius-based prefilter to reduce pairwise polygon checks.
         intersecting_entites = []
 
         valid_init_positions = {k: v for k, v in init_positions.items() if self._is_numeric_position(v)}
 
-        polygons, max_entity_radius = self._get_entities_bbox(valid_init_positions)
+        polygons = self._get_entities_bbox(valid_init_positions)
         if len(polygons) > 1:
-            if filter_by_radius:
-                distances = sp.spatial.distance.cdist(
-                    np.array(list(valid_init_positions.values())),
-                    np.array(list(valid_init_positions.values()))
-                )
-                distances = np.triu(distances)
+            # entities in the order of their initial positions, so the pairs come out in that order
+            entity_names = [entity_name for entity_name in valid_init_positions if entity_name in polygons]
+            entity_polygons = [polygons[entity_name] for entity_name in entity_names]
+            positions = np.array([valid_init_positions[entity_name] for entity_name in entity_names], dtype=float)
 
-                possible_intersection_indices = np.where(
-                    np.logical_and(distances < 2 * max_entity_radius, distances > 1e-6)
-                )
-                valid = possible_intersection_indices[0] != possible_intersection_indices[1]
-                possible_intersection_indices_a = possible_intersection_indices[0][valid]
-                possible_intersection_indices_b = possible_intersection_indices[1][valid]
-            else:
-                possible_intersection_indices_a, possible_intersection_indices_b = list(range(len(polygons)))
-
-            for index_a, index_b in zip(possible_intersection_indices_a, possible_intersection_indices_b):
-                intersection = polygons[index_a].intersection(polygons[index_b])
-                if not intersection.is_empty:
-                    entity_a = list(valid_init_positions.keys())[index_a]
-                    entity_b = list(valid_init_positions.keys())[index_b]
-                    intersecting_entites.append([entity_a, entity_b])
+            # the tree prefilters by bounding box, only candidate pairs are tested for intersection
+            tree = shapely.STRtree(entity_polygons)
+            indices_a, indices_b = tree.query(entity_polygons, predicate='intersects')
+
+            # each pair once, entities at identical positions are reported separately
+            distances = np.linalg.norm(positions[indices_a] - positions[indices_b], axis=1)
+            pairs = (indices_a < indices_b) & (distances > 1e-6)
+            for index_a, index_b in sorted(zip(indices_a[pairs].tolist(), indices_b[pairs].tolist())):
+                intersecting_entites.append([entity_names[index_a], entity_names[index_b]])
 
         return intersecting_entites
 
@@ -921,33 +997,26 @@ class FileQualityChecker:
         Get entities' corners and create polygons with them.
         Args:
             init_positions: Dict of entity name to (x, y).
-        return: (polygons_list, max_entity_radius)
+        return: Dict of entity name to bounding box polygon.
         """
         # Bounding boxes are defined in the scenario object geometry.
-        polygons = []
-        max_entity_radius = -np.inf
+        entity_names = []
+        boxes = []
 
         for scenario_object in self.scenario.entities.scenario_objects:
             if scenario_object.name in init_positions.keys():
                 init_position = init_positions[scenario_object.name]
                 if self._is_numeric_position(init_position) and hasattr(scenario_object.entityobject, 'boundingbox'):
-                    length = scenario_object.entityobject.boundingbox.boundingbox.length
-                    width = scenario_object.entityobject.boundingbox.boundingbox.width
-
-                    coords = (
-                        (init_position[0] + length / 2, init_position[1] + width / 2),
-                        (init_position[0] + length / 2, init_position[1] - width / 2),
-                        (init_position[0] - length / 2, init_position[1] - width / 2),
-                        (init_position[0] - length / 2, init_position[1] + width / 2),
-                    )
-                    polygon = shapely.Polygon(coords)
-                    polygons.append(polygon)
-
-                    radius = shapely.minimum_bounding_radius(polygon)
-                    if radius > max_entity_radius:
-                        max_entity_radius = radius
+                    boundingbox = scenario_object.entityobject.boundingbox.boundingbox
+                    entity_names.append(scenario_object.name)
+                    boxes.append((init_position[0], init_position[1], boundingbox.length, boundingbox.width))
 
-        return polygons, max_entity_radius
+        if len(boxes) == 0:
+            return {}
+        # all boxes are created in one vectorized call
+        x, y, length, width = np.array(boxes, dtype=float).T
+        polygons = shapely.box(x - length / 2, y - width / 2, x + length / 2, y + width / 2)
+        return dict(zip(entity_names, polygons))
 
     def _get_added_and_removed_entities(self):
         """
@@ -960,24 +1029,22 @@ class FileQualityChecker:
         added_entities = []
         removed_entities = []
 
-        for story in self.scenario.storyboard.stories:
-            for act in story.acts:
-                for maneuvergroup in act.maneuvergroup:
-                    actors = [actor.entity for actor in maneuvergroup.actors.actors]
-                    if len(actors) > 1:
-                        logger.warning(
-                            f"Multiple actors in maneuver group; applying add/remove events to all actors: {actors}"
-                        )
-
-                    for maneuver in maneuvergroup.maneuvers:
-                        for event in maneuver.events:
-                            for actor in actors:
-                                if '$' in actor:
-                                    continue
-                                if 'Add_' in event.name:
-                                    added_entities.append(actor)
-                                elif 'Remove_' in event.name:
-                                    removed_entities.append(actor)
+        for maneuvergroup in self._iter_maneuvergroups():
+            actors = [actor.entity for actor in maneuvergroup.actors.actors]
+            if len(actors) > 1:
+                logger.warning(
+                    f"Multiple actors in maneuver group; applying add/remove events to all actors: {actors}"
+                )
+
+            for maneuver in maneuvergroup.maneuvers:
+                for event in maneuver.events:
+                    for actor in actors:
+                        if '$' in actor:
+                            continue
+                        if 'Add_' in event.name:
+                            added_entities.append(actor)
+                        elif 'Remove_' in event.name:
+                            removed_entities.append(actor)
 
         if len(set(added_entities)) != len(added_entities):
             logger.warning("Duplicate Add_ events detected for one or more entities.")
@@ -998,76 +1065,67 @@ class FileQualityChecker:
         return: List of missing entities.
         """
         # The accounting should balance; otherwise report missing entities.
-        if set(added_entities).intersection(set(list(init_positions.keys()))):
+        added = set(added_entities)
+        removed = set(removed_entities)
+        parked = set(parked_entities)
+        if not added.isdisjoint(init_positions):
             logger.warning("Entities appear both in init positions and Add_ events.")
-        if set(removed_entities).intersection(set(parked_entities)):
+        if not removed.isdisjoint(parked):
             logger.warning("Entities appear both in Remove_ events and parked entities.")
 
         missing_in = []
 
-        if len(added_entities) + len(init_positions) - len(removed_entities) - len(parked_entities) != 0:
-            all_entities = added_entities + list(init_positions.keys()) + removed_entities
-            in_entities = added_entities + list(init_positions.keys())
-
-            missing_in = list(set(all_entities) - set(in_entities))
+        if len(added) + len(init_positions) - len(removed) - len(parked) != 0:
+            # removed entities that were never initialized or added, in the order they are removed
+            missing_in = [entity for entity in dict.fromkeys(removed_entities)
+                          if entity not in added and entity not in init_positions]
 
         return missing_in
 
     @staticmethod
-    def _build_dynamic_data_df(positions, times):
+    def _build_dynamic_data_arrays(positions, times):
         """
-        Build a dataframe of positions and times.
+        Build arrays of positions and times.
         Args:
             positions: List of position objects.
             times: List of timestamps.
-        return: Pandas DataFrame with time, x, y, h.
+        return: DynamicSeries with time, x, y, h as float arrays (missing values are nan).
         """
-        # Extract x/y/h fields for vectorized downstream calculations.
-        xs = []
-        ys = []
-        hs = []
-        for position in positions:
-            xs.append(position.x)
-            ys.append(position.y)
-            hs.append(position.h)
-
-        df = pd.DataFrame(times, columns=['time'])
-        df['x'] = xs
-        df['y'] = ys
-        df['h'] = hs
-
-        return df
+        # Extract x/y/h fields in one pass, the transposed copy gives contiguous x, y and h rows.
+        get_xyh = operator.attrgetter('x', 'y', 'h')
+        x, y, h = np.array([get_xyh(position) for position in positions], dtype=float).reshape(-1, 3).T.copy()
+
+        return DynamicSeries(np.array(times, dtype=float), x, y, h)
 
     @staticmethod
-    def _calculate_acceleration_swimangle(df, threshold=0.5 / 3.6, rolling_window=20):
+    def _calculate_acceleration_swimangle(series, threshold=0.5 / 3.6, rolling_window=20):
         """
         Calculate acceleration and swim angle at every time step.
         Args:
-            df: DataFrame with time, x, y, h columns.
+            series: DynamicSeries with time, x, y, h arrays.
             threshold: Minimum speed threshold for filtering movement angle.
             rolling_window: Window size for rolling mean calculations.
-        return: DataFrame with added speed, acceleration, and swimangle columns.
+        return: DynamicSeries with added speed, acceleration, and swimangle arrays.
         """
         # Derived values are finite differences across the trajectory.
-        dt = df['time'].diff().rolling(window=rolling_window, center=True).mean()
-        dx = df['x'].diff().rolling(window=rolling_window, center=True).mean()
-        dy = df['y'].diff().rolling(window=rolling_window, center=True).mean()
-        
-        df['speed'] = (np.sqrt(dx**2 + dy**2) / dt )
-        df['acceleration'] = df['speed'].diff() / dt
-        
-        df['movement_angle'] = np.arctan2(dy, dx)
-        df['movement_angle'] = df['movement_angle'].bfill()
-        
-        mask = (df.speed > threshold)
-        
-        df['filtered_movement_angle'] = df['movement_angle'].where(mask).ffill().bfill()
-        df['swimangle'] = df['h'].fillna(0) - df['filtered_movement_angle']
-        
-        df['swimangle'] = ((df['swimangle'] + np.pi) % (2 * np.pi)) - np.pi
-        
-        return df
-    
+        dt = _centered_rolling_mean(np.diff(series.time, prepend=np.nan), rolling_window)
+        dx = _centered_rolling_mean(np.diff(series.x, prepend=np.nan), rolling_window)
+        dy = _centered_rolling_mean(np.diff(series.y, prepend=np.nan), rolling_window)
+
+        speed = np.sqrt(dx**2 + dy**2) / dt
+        acceleration = np.diff(speed, prepend=np.nan) / dt
+
+        movement_angle = _fill_backward(np.arctan2(dy, dx))
+
+        mask = speed > threshold
+
+        filtered_movement_angle = _fill_backward(_fill_forward(np.where(mask, movement_angle, np.nan)))
+        swimangle = np.nan_to_num(series.h, nan=0.0) - filtered_movement_angle
+
+        swimangle = ((swimangle + np.pi) % (2 * np.pi)) - np.pi
+
+        return series._replace(speed=speed, acceleration=acceleration, swimangle=swimangle)
+
     def create_single_report(self, title, out_path):
         """
         Generate a PDF report for the current scenario.
@@ -1087,52 +1145,41 @@ class FileQualityChecker:
             out_path: Output directory for the CSV.
         """
         csv_file = out_path / Path(name + '.csv')
+        # all rows are collected first and written with one writerows call
+        rows = [
+            ['scenario_file', self.file_path],
+            ['xml_loadable', self.xml_loadable],
+            ['xsd_valid', self.xsd_valid],
+            ['version', self.version.replace('-', '.') if self.version else self.version],
+            ['author', self.author],
+            ['date', self.date],
+            ['simulation_status', self.simulation_status],
+        ]
+        rows.extend([road_user, count] for road_user, count in self.road_user_counts.items())
+
+        # one title row per category, followed by one row per entry
+        file_error_sections = zip(
+            ('missing_entity_definitions', 'identical_initposition_entities', 'intersecting_entities', 'missing_in'),
+            self.file_errors)
+        dynamic_error_sections = zip(
+            ('acceleration_errors', 'acceleration_warnings', 'swimangle_errors', 'swimangle_warnings'),
+            self.dynamic_errors or ([], [], [], []))
+
+        rows.extend([[], ['file_errors']])
+        for title, entries in file_error_sections:
+            rows.append([title])
+            rows.extend([entry] for entry in entries)
+        rows.append(['position_resolution_warnings'])
+        rows.extend([warning] for warning in self.position_resolution_warnings)
+
+        rows.extend([[], ['dynamic_errors']])
+        for title, entries in dynamic_error_sections:
+            rows.append([title])
+            rows.extend([entry] for entry in entries)
+
         with open(csv_file, mode="w", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(['scenario_file', self.file_path])
-            writer.writerow(['xml_loadable', self.xml_loadable])
-            writer.writerow(['xsd_valid', self.xsd_valid])
-            writer.writerow(['version', self.version.replace('-', '.') if self.version else self.version])
-            writer.writerow(['author', self.author])
-            writer.writerow(['date', self.date])
-            writer.writerow(['simulation_status', self.simulation_status])
-            for road_user, count in self.road_user_counts.items():
-                writer.writerow([road_user, count])
-            
-            writer.writerow([])
-            writer.writerow(['file_errors'])
-            writer.writerow(['missing_entity_definitions'])
-            for missing_entity_definition in self.file_errors[0]:
-                writer.writerow([missing_entity_definition])
-            writer.writerow(['identical_initposition_entities'])
-            for identical_initposition_entity in self.file_errors[1]:
-                writer.writerow([identical_initposition_entity])
-            writer.writerow(['intersecting_entities'])
-            for intersecting_entity in self.file_errors[2]:
-                writer.writerow([intersecting_entity])
-            writer.writerow(['missing_in'])
-            for missing_in in self.file_errors[3]:
-                writer.writerow([missing_in])
-
-            writer.writerow(['position_resolution_warnings'])
-            for warning in self.position_resolution_warnings:
-                writer.writerow([warning])
-            
-            writer.writerow([])
-            writer.writerow(['dynamic_errors'])
-            writer.writerow(['acceleration_errors'])
-            for acceleration_error in (self.dynamic_errors or ([], [], [], []))[0]:
-                writer.writerow([acceleration_error])
-            writer.writerow(['acceleration_warnings'])
-            for acceleration_warning in (self.dynamic_errors or ([], [], [], []))[1]:
-                writer.writerow([acceleration_warning])
-            writer.writerow(['swimangle_errors'])
-            for swimangle_error in (self.dynamic_errors or ([], [], [], []))[2]:
-                writer.writerow([swimangle_error])
-            writer.writerow(['swimangle_warnings'])
-            for swimangle_warning in (self.dynamic_errors or ([], [], [], []))[3]:
-                writer.writerow([swimangle_warning])
-                
+            csv.writer(file).writerows(rows)
+
         if self.print_log:
             logger.info(f'CSV report created at {csv_file}')
         return
@@ -1171,8 +1218,42 @@ def quality_check_single(
     if print_log:
         logger.info(f"Analysis completed for {str(file_path)}.")
     return fqc
-    
-    
+
+
+def _check_file_of_batch(file_path, out_path, schema_path, esmini_path, single, out_pdf, out_csv, print_log):
+    """
+    Check one file of quality_check_multiple, used by the worker processes.
+    Args:
+        file_path: Path to the scenario file.
+        out_path: Output directory for single reports.
+        schema_path: Path to schema files.
+        esmini_path: Path to the esmini executable.
+        single: Whether to generate a single report for the file.
+        out_pdf: Whether to create a PDF report.
+        out_csv: Whether to create a CSV report.
+        print_log: Whether to emit log output.
+    return: Summary row tuple of the file.
+    """
+    if single:
+        checker = quality_check_single(file_path, out_path, schema_path, esmini_path, out_pdf, out_csv, print_log)
+    else:
+        checker = quality_check_single(file_path, out_path, schema_path, esmini_path, False, False, False)
+    return checker.to_summary_row()
+
+
+def _list_scenario_files(files_path):
+    """
+    List the .xosc files of a directory with their sizes.
+    Args:
+        files_path: Directory containing .xosc files.
+    return: List of paths of the scenario files and list of their sizes in bytes.
+    """
+    # scandir entries cache their file type and stat result, so every file is looked up once
+    with os.scandir(files_path) as entries:
+        scenario_entries = [entry for entry in entries if entry.name.endswith('.xosc') and entry.is_file()]
+    return [Path(entry.path) for entry in scenario_entries], [entry.stat().st_size for entry in scenario_entries]
+
+
 @app.command("quality_check_multiple")
 def quality_check_multiple(
     files_path: Path = typer.Option(...),
@@ -1183,7 +1264,8 @@ def quality_check_multiple(
     aggregated: bool = typer.Option(False),
     out_pdf: bool = typer.Option(False),
     out_csv: bool = typer.Option(False),
-    print_log: bool = typer.Option(False)): 
+    print_log: bool = typer.Option(False),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="Number of worker processes used to check the files, 0 uses one per CPU")):
     """
     Check multiple scenarios and optionally output reports.
     Args:
@@ -1196,7 +1278,8 @@ def quality_check_multiple(
         out_pdf: Whether to create a PDF report.
         out_csv: Whether to create a CSV report.
         print_log: Whether to emit log output.
-    return: Aggregated summary list or -1 on invalid input.
+        jobs: Number of worker processes, files are checked one after another if 1 and 0 uses one per CPU.
+    return: Aggregated summary list, None without aggregation, -1 on invalid input or if no report is requested.
     """
     if print_log:
         logger.info(f'Starting analysis of all .xosc files in {files_path}')
@@ -1205,32 +1288,52 @@ def quality_check_multiple(
     if not files_path.is_dir():
         logger.error('Files path is not a directory')
         return -1
-        
-    # Collect per-file checkers when aggregation is requested.
-    aggregated_checkers = [] if aggregated else None
-    for file in files_path.glob('*.xosc'):
-        if single:
-            Path(out_path / Path('single_reports/')).mkdir(parents=True, exist_ok=True)
-            checker = quality_check_single(file, out_path / Path('single_reports/'), schema_path, esmini_path, out_pdf, out_csv)
-        else:
-            checker = quality_check_single(file, out_path / Path('single_reports/'), schema_path, esmini_path, False, False, False)
 
-        if aggregated:
-            aggregated_checkers.append(checker)
+    # without single or aggregated reports the checks would produce no output
+    if not single and not aggregated:
+        logger.warning('Neither --single nor --aggregated is set, no files are checked')
+        return -1
+
+    if jobs < 1:
+        jobs = os.cpu_count() or 1
+
+    files, file_sizes = _list_scenario_files(files_path)
+
+    # the directory of the single reports is created once for the whole batch
+    single_reports_path = out_path / Path('single_reports/')
+    if single:
+        single_reports_path.mkdir(parents=True, exist_ok=True)
+
+    # the report flags are bound once, _check_file_of_batch picks the variant for single reports
+    check_file = functools.partial(_check_file_of_batch, out_path=single_reports_path,
+                                   schema_path=schema_path, esmini_path=esmini_path, single=single,
+                                   out_pdf=out_pdf, out_csv=out_csv, print_log=print_log)
+    if jobs > 1:
+        # Files are independent, so they are checked (and their single reports written) in worker processes.
+        # largest files are handed out first, one per task, so no long check starts at the end of the
+        # batch (longest processing time first); the rows are put back into file order afterwards
+        order = sorted(range(len(files)), key=file_sizes.__getitem__, reverse=True)
+        aggregated_rows = [None] * len(files)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            rows = executor.map(check_file, [files[index] for index in order], chunksize=1)
+            for index, row in zip(order, rows):
+                aggregated_rows[index] = row
+    else:
+        aggregated_rows = list(map(check_file, files))
     
     if aggregated:
         title = 'Aggregated report'
-        information_summary = [list(checker.to_summary_row()) for checker in aggregated_checkers]
+        information_summary = aggregated_rows
 
         # create report (pdf and/or csv)
         if out_pdf:
             create_report_multiple(title, information_summary, out_path, print_log)
         if out_csv:
-            # Prepend a header row for CSV export.
-            information_summary.insert(0, ['scenario_file', 'xml_loadable', 'xsd_valid', 'simulation_status', 'n_file_errors', 'n_dynamic_errors'])
             csv_file = out_path / Path('aggregate_data.csv')
             with open(csv_file, mode="w", newline="") as file:
                 writer = csv.writer(file)
+                # header row is written ahead of the rows instead of being inserted into the summary list
+                writer.writerow(['scenario_file', 'xml_loadable', 'xsd_valid', 'simulation_status', 'n_file_errors', 'n_dynamic_errors'])
                 writer.writerows(information_summary)
             if print_log:
                 logger.info(f'CSV report created at {csv_file}')
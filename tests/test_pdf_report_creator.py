@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from quality_checker.pdf_report_creator import fading_line_segments
+from quality_checker.quality_checker import DynamicSeries
+
+
+@pytest.mark.parametrize("n_points, expected_lengths", [(10, [10]), (20, [11, 10]), (21, [11, 11])])
+def test_fading_line_segments(n_points, expected_lengths):
+    x = np.arange(n_points, dtype=float)
+    series = DynamicSeries(time=x, x=x, y=-x, h=np.zeros(n_points))
+
+    segments, colors = fading_line_segments(series, segment_size=10, arrow_size=1)
+
+    assert [len(segment) for segment in segments] == expected_lengths
+    assert len(colors) == len(segments)
+    # consecutive segments share their end point and the last one ends at the end of the track
+    assert segments[0][0, 0] == 0.0
+    assert segments[-1][-1, 0] == x[min(len(segments) * 10, n_points - 1)]